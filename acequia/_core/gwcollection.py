@@ -6,8 +6,6 @@ head series.
 import warnings
 from pandas import Series, DataFrame
 import pandas as pd
-from shapely.geometry import Point
-import geopandas as gpd
 
 from .._read.gwfiles import GwFiles
 from .._read.waterweb import WaterWeb
@@ -140,9 +138,12 @@ class GwCollection:
             self._calculate_series_stats(ref=ref)
 
 
+        # geopandas is slow to import, import only when needed
+        import geopandas as gpd
+
         xcr = self._stats['xcr'].astype('float').values
         ycr = self._stats['ycr'].astype('float').values
-        geometry = [Point(crd) for crd in zip(xcr,ycr)]
+        geometry = gpd.points_from_xy(xcr, ycr)
         points = gpd.GeoDataFrame(self._stats, geometry=geometry)
         points = points.set_crs('EPSG:28992')
 
@@ -206,9 +207,10 @@ class GwCollection:
 
         # create geodataframe
         if asgeo:
+            import geopandas as gpd
             xcr = stats['xcr'].astype('float').values
             ycr = stats['ycr'].astype('float').values
-            geometry = [Point(crd) for crd in zip(xcr,ycr)]
+            geometry = gpd.points_from_xy(xcr, ycr)
             stats = gpd.GeoDataFrame(stats, geometry=geometry)
             stats = stats.set_crs('EPSG:28992')
 
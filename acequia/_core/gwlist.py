@@ -206,15 +206,10 @@ class GwList():
             self._itercount = 0 # reset iterator
             raise StopIteration
 
-        if self._srctype == 'dinocsv':
-            idx = self._flist.index[self._itercount]
-            filename = self._flist.at[self._itercount,'path']
-            self.gw = gwseriesmod.GwSeries.from_dinogws(filename)
- 
-        if self._srctype == 'json':
+        if self._srctype in ['dinocsv','json']:
             idx = self._flist.index[self._itercount]
             filename = self._flist.at[idx,'path']
-            self.gw = gwseriesmod.GwSeries.from_json(filename)
+            self.gw = self.from_path(filename)
 
         if self._srctype == 'hymon':
             self.gw = next(self.hm)
@@ -239,6 +234,39 @@ class GwList():
             return len(self._wwn)
 
 
+    def paths(self):
+        """Return list of source file paths in list order, or None
+        for source types without separate files per series"""
+
+        if self._srctype in ['dinocsv','json']:
+            return list(self._flist['path'].values)
+
+        return None
+
+
+    def from_path(self,path):
+        """Return GwSeries object read from a single source file
+
+        Parameters
+        ----------
+        path : str
+            source file path as returned by paths()
+
+        Returns
+        -------
+        GwSeries object
+        """
+
+        if self._srctype=='dinocsv':
+            return gwseriesmod.GwSeries.from_dinogws(path)
+
+        if self._srctype=='json':
+            return gwseriesmod.GwSeries.from_json(path)
+
+        raise ValueError((f'Source type "{self._srctype}" has no '
+            f'separate source files per series.'))
+
+
     def is_callable(self):
         """Return True if object is waiting for a call"""
 
@@ -309,11 +337,7 @@ class GwList():
             indexval = row.index.values[0]
             filepath = self._flist.loc[indexval,'path']
 
-        if self._srctype=='json':
-            gw = gwseriesmod.GwSeries.from_json(filepath)
-
-        if self._srctype=='dinocsv':
-            gw = gwseriesmod.GwSeries.from_dinogws(filepath)
+            gw = self.from_path(filepath)
 
         if self._srctype=='hymon':
             for gw in self.hm:
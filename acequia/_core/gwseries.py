@@ -649,28 +649,18 @@ class GwSeries:
                 f'level. "mplevel"will be used instead.'))
             proptype = 'mplevel'
 
-        """
-        sr1 = self._tubeprops[['startdate','mplevel']].set_index('startdate').squeeze()
-        idx = sr1.index[1:] + pd.Timedelta(days=1)
-        lastdate = self._obs['headdatetime'].iloc[-1]
-        idx = idx.append(pd.to_datetime([lastdate]))
-        sr2 = Series( mps ,index=idx)
-        """
-
-        sr = self._tubeprops[['startdate','mplevel']].set_index('startdate').squeeze(axis=1)
+        from_dates = self._tubeprops['startdate'].values
+        values = self._tubeprops[proptype].values
 
         # create list of dates
-        from_dates = sr.index.values[:]
-        to_dates = sr.index.values[1:] - np.timedelta64(1,'D')
-        lastdate = self._obs['headdatetime'].values[-1]
-        to_dates = np.append(to_dates, lastdate)
-        dates = [item for sublist in zip(from_dates, to_dates) for item in sublist]
+        to_dates = np.append(from_dates[1:] - np.timedelta64(1,'D'),
+            self._obs['headdatetime'].values[-1])
+        dates = np.column_stack([from_dates, to_dates]).ravel()
 
-        values = np.repeat(sr.values, 2)
-        changes = Series(values, index=dates)
+        changes = Series(np.repeat(values, 2), index=dates)
 
         if relative:
-            changes = changes - changes[0]
+            changes = changes - changes.iloc[0]
 
         return changes
 
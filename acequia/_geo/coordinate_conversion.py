@@ -26,8 +26,7 @@ def convert_RDtoWGS84(x,y):
     >> (48.726255249201174, 6.458551281201178,)
        
     """
-    crc = CrdCon()
-    res = crc.convert_RDtoWGS84(x, y)
+    res = _crdcon.convert_RDtoWGS84(x, y)
     return (res['Lat'], res['Lon'])
 
 def convert_WGS84toRD(lat, lon):
@@ -51,8 +50,7 @@ def convert_WGS84toRD(lat, lon):
     >> (233883.06517103617, 582067.0401935352)
        
     """
-    crc = CrdCon()
-    res = crc.convert_WGS84toRD(lat, lon)
+    res = _crdcon.convert_WGS84toRD(lat, lon)
     return (res['xRD'], res['yRD'])
 
 
@@ -137,6 +135,33 @@ class CrdCon:
     E0zone32 = 252878.65
     N0zone32 = 5784453.44
 
+    # coefficients [p,q,R] for WGS84 to RD x-coordinate
+    RDX_COEF = (
+        (0,1,190094.945),
+        (1,1,-11832.228),
+        (2,1,-114.221),
+        (0,3,-32.391),
+        (1,0,-0.705),
+        (3,1,-2.340),
+        (1,3,-0.608),
+        (0,2,-0.008),
+        (2,3,0.148),
+        )
+
+    # coefficients [p,q,S] for WGS84 to RD y-coordinate
+    RDY_COEF = (
+        (1,0,309056.544),
+        (0,2,3638.893),
+        (2,0,73.077),
+        (1,2,-157.984),
+        (3,0,59.788),
+        (0,1,0.433),
+        (2,2,-6.439),
+        (1,1,-0.032),
+        (0,4,0.092),
+        (1,4,-0.054),
+        )
+
     def convert_RDtoWGS84(self, X, Y, Zone=False):
         """ Convert RD Xcoor,Ycoor to WGS84 latitude,longitude
         
@@ -414,17 +439,7 @@ class CrdCon:
         Lambda = Lon
         Phi = Lat
 
-        coef = [#p,q,Rpg
-               [0,1,190094.945],
-               [1,1,-11832.228],
-               [2,1,-114.221],
-               [0,3,-32.391],
-               [1,0,-0.705],
-               [3,1,-2.340],
-               [1,3,-0.608],
-               [0,2,-0.008],
-               [2,3,0.148]
-               ]
+        coef = self.RDX_COEF
         dPhi=0.36*(Phi-self.Phi0)
         dLambda=0.36*(Lambda-self.Lambda0)
         X = 0
@@ -441,18 +456,7 @@ class CrdCon:
 
         Lambda = Lon
         Phi = Lat
-        coef = [
-               [1,0,309056.544],
-               [0,2,3638.893],
-               [2,0,73.077],
-               [1,2,-157.984],
-               [3,0,59.788],
-               [0,1,0.433],
-               [2,2,-6.439],
-               [1,1,-0.032],
-               [0,4,0.092],
-               [1,4,-0.054]
-               ]
+        coef = self.RDY_COEF
         dPhi=0.36*(Phi-self.Phi0)
         dLambda=0.36*(Lambda-self.Lambda0)
         Y = 0
@@ -520,3 +524,8 @@ class CrdCon:
         Y+= D4*(pow(dE,4)-6*pow(dE,2)*pow(dN,2)+pow(dN,4))+C4*(4*pow(dE,3)*dN-4*pow(dN,3)*dE)
 
         return [X,Y]
+
+
+# CrdCon keeps no state between conversions, so the module functions 
+# share one instance
+_crdcon = CrdCon()
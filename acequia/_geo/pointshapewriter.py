@@ -4,8 +4,6 @@ import warnings
 import numpy as np
 from pandas import DataFrame,Series
 import pandas as pd
-from shapely.geometry import Point
-from geopandas import GeoDataFrame
 
 
 
@@ -97,8 +95,11 @@ class PointShapeWriter:
 
     def _create_shapefile(self):
 
+        # geopandas is slow to import, import only when needed
+        from geopandas import GeoDataFrame, points_from_xy
+
         wp = self.tbl
-        geometry = [Point(xy) for xy in zip(wp['xcr'],wp['ycr'])]
+        geometry = points_from_xy(wp['xcr'],wp['ycr'])
         self.gdf = GeoDataFrame(wp, geometry=geometry)
         self.gdf = self.gdf.set_crs('epsg:7415')
 
@@ -56,7 +56,7 @@ class PlotHeads:
 
     def __init__(self,ts=[],ref="datum",lbs=None,mps=None,
         title=None,xlabel=None,ylabel=None,xlim=None,
-        ylim=None,colors=None,plotargs=None,plot=True):
+        ylim=None,colors=None,plotargs=None,plot=True,fig=None):
         """ Plot list of groundwater head series in one graph
 
         Parameters
@@ -85,6 +85,9 @@ class PlotHeads:
             dict of pyplot plotting parameters for each series
         plot : boolean, default True
             plot heads immediately (if Flase, call PlotHeads.plotheads()
+        fig : matplotlib.figure.Figure, optional
+            existing figure to draw on, figure is cleared before use
+            (if not given, a new figure is created)
 
         Notes
         -----
@@ -145,6 +148,7 @@ class PlotHeads:
         self.title = title
         self.ylabel = ylabel
         self.xlabel = xlabel
+        self._userfig = fig
 
         if lbs is None:
             self.lbs = [sr.name for sr in self.ts]
@@ -198,7 +202,14 @@ class PlotHeads:
 
         #self.fig = plt.figure(figsize=(9, 8), dpi= 80, facecolor='#eeefff', 
         #                        edgecolor='k')
-        self._fig = plt.figure(figsize=(8, 5),facecolor='#eeefff')
+        if self._userfig is None:
+            self._fig = plt.figure(figsize=(8, 5),facecolor='#eeefff')
+        else:
+            # reuse existing figure to avoid allocating a new one
+            self._fig = self._userfig
+            self._fig.clear()
+            self._fig.set_size_inches(8, 5)
+            self._fig.set_facecolor('#eeefff')
 
         if self.mps is None: ## and len(description)==0:
 
@@ -445,9 +456,9 @@ class PlotHeads:
     def _set_axlabels(self):
 
         if self.ylabel:
-            plt.ylabel(self.ylabel, size = 11.0)
+            self._axgws.set_ylabel(self.ylabel, size = 11.0)
         else:
-            plt.ylabel('grondwaterstand',size = 11.0)
+            self._axgws.set_ylabel('grondwaterstand',size = 11.0)
 
         self.axeslist['axgws'].set_xlabel('')
 
@@ -529,9 +540,9 @@ class PlotHeads:
         self._axgws.grid(True,which="minor",ls=":")
 
         if self.title and (self.mps is None):
-            plt.text(0.0,1.02,self.title,transform=self._axgws.transAxes)
+            self._axgws.text(0.0,1.02,self.title,transform=self._axgws.transAxes)
         elif self.title:
-            plt.text(0.0,1.1,self.title,transform=self._axmp.transAxes)
+            self._axmp.text(0.0,1.1,self.title,transform=self._axmp.transAxes)
 
         # plot datespan right of graph 90 degrees upward
         #timespan = self.mindate().strftime("%d-%m-%Y")+" t/m " \
@@ -70,12 +70,15 @@ class BroGldXml:
         "xsi" : "http://www.w3.org/2001/XMLSchema-instance",
         }
 
-    def __init__(self, tree): ##, xmlsource='file'):
+    def __init__(self, tree, obs=None): ##, xmlsource='file'):
         """
         Parameters
         ----------
         tree : ElementTree tree object
             Valid XML tree with groundwater level measurement data (GLD).
+        obs : list of dict, optional
+            Observations that were already read from the tree. Only 
+            used by BroGldXml.from_xml_iter().
         xmlsource : {'file','rest'}, default 'file'
             Source of the XML tree (namespaces are different for 
             various sources).
@@ -85,6 +88,7 @@ class BroGldXml:
         gld = BroGld(<elementtree>)"""
 
         self._tree = tree
+        self._obsrecords = obs
         #self._root = self._tree.getroot()
 
 
@@ -123,6 +127,73 @@ class BroGldXml:
         return cls(cls._tree)
 
 
+    @classmethod
+    def from_xml_iter(cls, xmlpath):
+        """Read BRO GLD object from XML file, reading measurements 
+        while the file is parsed.
+
+        Parameters
+        ----------
+        xmlpath : str
+            Valid filepath to XML file with groundwater level measurements.
+
+        Returns
+        -------
+        BroGldXml object
+
+        Notes
+        -----
+        Measurement elements are removed from the tree as soon as their
+        values have been read. Memory use for files with many 
+        measurements is much lower than with BroGldXml.from_xml().
+
+        Example
+        -------
+        gld = BroGldXml.from_xml_iter(<valid xml filepath>)
+
+        """
+        if not os.path.isfile(xmlpath):
+            raise ValueError(f'Invalid filepath: "{xmlpath}".')
+
+        ns6 = cls.NS['ns6']
+        seriestag = f'{{{ns6}}}MeasurementTimeseries'
+        tvptag = f'{{{ns6}}}MeasurementTVP'
+        pointtag = f'{{{ns6}}}point'
+
+        root = None
+        obs = []
+        series_obs = []
+        for event, elem in ET.iterparse(xmlpath, events=('start','end')):
+
+            if root is None:
+                root = elem
+
+            if event!='end':
+                continue
+
+            if elem.tag==tvptag:
+                series_obs.append({
+                    'time':elem.find(f'.//{cls.GLDOBSTAGS["obstime"]}',cls.NS).text,
+                    'value':elem.find(f'.//{cls.GLDOBSTAGS["obsvalue"]}',cls.NS).text,
+                    'quality':elem.find(f'.//{cls.GLDOBSTAGS["TVPMeasurementMetadata"]}',cls.NS).text,
+                    })
+                elem.clear()
+
+            elif elem.tag==seriestag:
+                attdict = elem.attrib
+                tsid = [attdict[key] for key in attdict.keys()][0]
+                tsid = tsid.split('_')[1]
+                for rec in series_obs:
+                    rec['timeseries'] = tsid
+                obs.extend(series_obs)
+                series_obs = []
+
+                # remove emptied measurement elements from tree
+                for point in elem.findall(pointtag):
+                    elem.remove(point)
+
+        return cls(ET.ElementTree(root), obs=obs)
+
     @classmethod
     def from_server(cls, gldid=None, startdate=None, enddate=None, 
         reference=None):
@@ -222,6 +293,13 @@ class BroGldXml:
     @property
     def obs(self):
         """Get all observation data."""
+        if self._obsrecords is not None:
+            # observations were read while parsing the file
+            if not self._obsrecords:
+                return DataFrame()
+            return DataFrame(self._obsrecords).sort_values(
+                by='time').reset_index(drop=True)
+
         tslist = []
         for srnode in self._tree.iterfind(f'.//{self.GLDOBSTAGS["MeasurementTimeseries"]}',self.NS):
 
@@ -276,19 +354,34 @@ class BroGldXml:
 
         return obsprops
 
+    def _obsarrays(self):
+        """Return arrays with times and values of all observations."""
+        if self._obsrecords is not None:
+            times = [rec['time'] for rec in self._obsrecords]
+            values = [rec['value'] for rec in self._obsrecords]
+        else:
+            times = []
+            values = []
+            for msnode in self._tree.iterfind(f'.//{self.GLDOBSTAGS["MeasurementTVP"]}',self.NS):
+                times.append(msnode.find(f'.//{self.GLDOBSTAGS["obstime"]}',self.NS).text)
+                values.append(msnode.find(f'.//{self.GLDOBSTAGS["obsvalue"]}',self.NS).text)
+        return np.array(times, dtype=object), pd.to_numeric(
+            np.array(values, dtype=object), errors='coerce')
+
     @property
     def heads(self):
         """Return time series with groundwater levels."""
 
-        if self._obs.empty:
+        times, levels = self._obsarrays()
+        if len(times)==0:
             return Series(dtype='object')
 
-        levels = self.obs['value'].astype(float).values
         datetimes = pd.DatetimeIndex(
-            pd.to_datetime(self.obs['time'],
-            infer_datetime_format=True, utc=True)).tz_localize(None)
+            pd.to_datetime(times, infer_datetime_format=True, 
+            utc=True)).tz_localize(None)
+        order = np.argsort(datetimes.values, kind='stable')
         name = self.gldprops['broIdGld']
-        heads = Series(data=levels,index=datetimes,name=name)
+        heads = Series(data=levels[order],index=datetimes[order],name=name)
         if heads.index.has_duplicates:
             dupcount = len(heads[heads.index.duplicated(keep='first')])
             #warnings.warn(f'Removed {dupcount} duplicate datetimes from head series {name}.')
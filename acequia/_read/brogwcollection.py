@@ -18,6 +18,19 @@ class BroGwCollection:
         self._tubes = tubes
         self.name = name
 
+        # mappings for fast lookup of well ids, wellcodes and tubes
+        self._gmwid_by_wellcode = {}
+        self._wellcode_by_gmwid = {}
+        self._tubes_by_gmwid = {}
+        if (wells is not None) and (not wells.empty):
+            self._gmwid_by_wellcode = dict(zip(wells['wellcode'], 
+                wells['gmwid']))
+            self._wellcode_by_gmwid = dict(zip(wells['gmwid'], 
+                wells['wellcode']))
+        if (tubes is not None) and (not tubes.empty):
+            self._tubes_by_gmwid = tubes.groupby('gmwid')['tubenr'].agg(
+                list).to_dict()
+
     def __repr__(self):
     
         name = self.name
@@ -64,8 +77,9 @@ class BroGwCollection:
             return cls(wells=DataFrame(), tubes=DataFrame(), name=name)
 
         tubes = []
-        for gmwid in wells['gmwid'].values:
-            welltubes = brorest.get_welltubes(gmwid)
+        alltubes = brorest.get_many(brorest.get_welltubes, 
+            wells['gmwid'].values)
+        for welltubes in alltubes:
             if welltubes.empty:
                 continue
             welltubes.insert(1,'tubenr',welltubes.index.values)
@@ -82,12 +96,47 @@ class BroGwCollection:
     def tubes(self):
         return self._tubes
 
+    @property
+    def names(self):
+        """Return list of series names without downloading series."""
+        if self._tubes.empty:
+            return []
+        return list(self._tubes['gmwid'] + '_' + self._tubes['tubenr'])
+
     @property
     def empty(self):
         if self.wells.empty | self.tubes.empty:
             return True
         return False
 
+    def lookup(self, gmwid=None, wellcode=None):
+        """Return well id, wellcode and tube numbers for one well.
+
+        Parameters
+        ----------
+        gmwid : str, optional
+            Valid BRO GMW well ID.
+        wellcode : str, optional
+            Valid wellcode (alternative to gmwid).
+
+        Returns
+        -------
+        dict
+            Dictionary with keys 'gmwid', 'wellcode' and 'tubes'. Values
+            are None (or an empty list for tubes) when the well is not 
+            in the collection.
+        """
+        if isinstance(wellcode, str):
+            gmwid = self._gmwid_by_wellcode.get(wellcode)
+        else:
+            wellcode = self._wellcode_by_gmwid.get(gmwid)
+
+        return {
+            'gmwid' : gmwid,
+            'wellcode' : wellcode,
+            'tubes' : list(self._tubes_by_gmwid.get(gmwid, [])),
+            }
+
     def get_gwseries(self, gmwid=None, wellcode=None, tube=None):
         """Get gwseries for one well tube.
         
@@ -107,11 +156,8 @@ class BroGwCollection:
         """
         # get gmwid from wellcode
         if isinstance(wellcode, str):
-            wellcodes = self._wells[self._wells['wellcode']==wellcode]
-            if not wellcodes.empty:
-                idx = wellcodes.index[0]
-                gmwid = self._wells.loc[idx, 'gmwid']
-            else:
+            gmwid = self._gmwid_by_wellcode.get(wellcode)
+            if gmwid is None:
                 # wellcode not found
                 warnings.warn((f'Wellcode {wellcode} not found.'
                     f'in collection {self.name}.'))
@@ -98,10 +98,8 @@ class BroGwSeries:
         # get all gld xmls from REST server
         tube = str(tube)
         tubegld = brorest.get_welltubes(gmwid).loc[[tube],:]
-        gldxml = []
-        for gldid in tubegld['gldid'].values:
-            gld = BroGldXml.from_server(gldid)
-            gldxml.append(gld)
+        gldxml = brorest.get_many(BroGldXml.from_server, 
+            tubegld['gldid'].values)
 
         gldprops, obs, obsprops, procesprops, timeseriescounts = cls._get_gld_properties(gldxml)
 
@@ -2,13 +2,53 @@
 Module with functions for retrieving data fro BRO REST service.
 """
 import datetime as dt
+import warnings
+from io import BytesIO
+from concurrent.futures import ThreadPoolExecutor
 import requests
+from urllib3.util.retry import Retry
 #import lxml.etree as ET
 import xml.etree.ElementTree as ET
 from pandas import Series, DataFrame
 import pandas as pd
+from . import httpsession
 
 STARTDATE = '1900-01-01'
+TIMEOUT = 10 # seconds to wait for BRO server response
+MAX_WORKERS = 8 # number of simultaneous requests to BRO server
+WELL_NUMCOLS = ['surfacelevel','tubes','diamin','diamax','filshallow',
+    'fildeep'] # numeric columns in table of area well properties
+CACHE_NAME = 'acequia_bro_cache' # sqlite file in cache directory
+CACHE_EXPIRE = 86400 # seconds before cached BRO responses expire
+
+def _create_session(cache=False, cache_dir=None):
+    """Return requests session with connection pool and retries,
+    responses are cached only if cache is True."""
+    retry = Retry(total=5, backoff_factor=0.3, 
+        status_forcelist=[429,500,502,503,504])
+    return httpsession.create_session(retry, 
+        pool_connections=MAX_WORKERS, pool_maxsize=MAX_WORKERS, 
+        cache=cache, cache_name=CACHE_NAME, cache_dir=cache_dir, 
+        expire_after=CACHE_EXPIRE, allowable_methods=('GET','POST'))
+
+# one session for all requests reuses connections to the BRO server
+_session = _create_session(cache=httpsession.cache_requested())
+
+def enable_cache(enable=True, cache_dir=None):
+    """Cache BRO server responses for CACHE_EXPIRE seconds.
+
+    Responses are stored in a sqlite database in directory cache_dir,
+    or in the user cache directory when cache_dir is not given. 
+    Requires package requests_cache. Use enable=False to return to 
+    requests without cache."""
+    global _session
+    _session = _create_session(cache=enable, cache_dir=cache_dir)
+
+def clear_cache():
+    """Remove all cached BRO server responses.
+
+    Does nothing when responses are not cached."""
+    httpsession.clear_cache(_session)
 
 def _parse_dispatchDocument(tree):
     pass
@@ -64,6 +104,8 @@ def get_area_wellprops(center=None, radius=None, lowerleft=None,
     Returns
     -------
     pd.DataFrame
+        Table with one row for each well. Columns in WELL_NUMCOLS are 
+        numeric, all other columns contain text.
 
     Examples
     --------
@@ -142,14 +184,11 @@ def get_area_wellprops(center=None, radius=None, lowerleft=None,
     headers = {'accept': 'application/xml',}
     params = {'requestReference': 'Punthuizen',}
 
-    response = requests.post('https://publiek.broservices.nl/gm/gmw/v1/characteristics/searches', 
-        params=params, headers=headers, json=json_data)
+    response = _session.post('https://publiek.broservices.nl/gm/gmw/v1/characteristics/searches', 
+        params=params, headers=headers, json=json_data, timeout=TIMEOUT)
         
-    # get xmltree from response
-    root = ET.fromstring(response.content)
-
-    # parse XML tree
-    # --------------
+    # parse XML response
+    # ------------------
 
     NS0 = 'http://www.broservices.nl/xsd/dsgmw/1.1'
     NS1 = 'http://www.broservices.nl/xsd/brocommon/3.0'
@@ -162,9 +201,7 @@ def get_area_wellprops(center=None, radius=None, lowerleft=None,
         }
 
     # data for each well is stored below the tag "GMW_C"
-    # find all wells
-    tag = 'GMW_C'
-    wells = root.findall(f'.//{{{NS0}}}{tag}', NS)
+    welltag = f'{{{NS0}}}GMW_C'
 
     welltags = {
         'gmwid' : f'.//{{{NS1}}}broId',
@@ -190,16 +227,24 @@ def get_area_wellprops(center=None, radius=None, lowerleft=None,
         'fildeep' : f'.//{{{NS0}}}screenPositionRange//{{{NS0}}}deepestScreenBottomPosition',
         }
 
+    # read wells while parsing and clear each well element after use,
+    # the full tree for large areas is never held in memory
+    columns = list(welltags.keys())
+    paths = list(welltags.values())
     data = []
-    for well in wells:
-        rec = {}
-        for key in welltags.keys():
-            try:
-                rec[key] = well.find(welltags[key], NS).text
-            except AttributeError:
-                rec[key] = pd.NA
-        data.append(rec.copy())
-    data = DataFrame(data)
+    for event, well in ET.iterparse(BytesIO(response.content), 
+        events=('end',)):
+        if well.tag!=welltag:
+            continue
+        nodes = [well.find(path, NS) for path in paths]
+        data.append(tuple(pd.NA if node is None else node.text 
+            for node in nodes))
+        well.clear()
+
+    # create table in one step and convert numeric columns
+    data = DataFrame.from_records(data, columns=columns)
+    for col in WELL_NUMCOLS:
+        data[col] = pd.to_numeric(data[col], errors='coerce')
     return data
 
 
@@ -233,8 +278,8 @@ def get_wellprops(gmwid=None, description=None):
         'fullHistory': 'ja',
         'requestReference': description,
         }
-    response = requests.get(f'https://publiek.broservices.nl/gm/gmw/v1/objects/{gmwid}',
-        params=params, headers=headers)
+    response = _session.get(f'https://publiek.broservices.nl/gm/gmw/v1/objects/{gmwid}',
+        params=params, headers=headers, timeout=TIMEOUT)
 
     root = ET.fromstring(response.content)
     tree = ET.ElementTree(root)
@@ -261,7 +306,7 @@ def get_welltubes(gmwid):
 
     # make request
     url = f'https://publiek.broservices.nl/gm/v1/gmw-relations/{gmwid}'
-    response = requests.get(url)
+    response = _session.get(url, timeout=TIMEOUT)
     resdict = response.json()
 
     # iterate over nested json dictionary:
@@ -297,7 +342,7 @@ def get_wellcode(gmwid):
     """
     url = ((f'https://publiek.broservices.nl/gm/gmw/v1/well-code/{gmwid}'
         f'?requestReference=myref'))
-    response = requests.get(url)
+    response = _session.get(url, timeout=TIMEOUT)
     return response.text
 
 def get_levels(gldid=None, startdate=None, enddate=None, reference=None):
@@ -329,7 +374,7 @@ def get_levels(gldid=None, startdate=None, enddate=None, reference=None):
     url = ((f'https://publiek.broservices.nl/gm/gld/v1/objects/{gldid}?'
         f'filtered={filtered}&observationPeriodBeginDate={startdate}&'
         f'observationPeriodEndDate={enddate}&requestReference={reference}'))
-    response = requests.get(url)
+    response = _session.get(url, timeout=TIMEOUT)
     status_code = response.status_code
     response_string = response.content
 
@@ -353,7 +398,7 @@ def get_gld_codes(bronhouder):
     """
     bronhouder = str(bronhouder)
     url = f'https://publiek.broservices.nl/gm/gld/v1/bro-ids?bronhouder={bronhouder}'
-    response = requests.get(url)
+    response = _session.get(url, timeout=TIMEOUT)
     response_status_code = response.status_code
     return response.json()['broIds']
 
@@ -372,6 +417,30 @@ def get_gmw_codes(bronhouder):
     """
     bronhouder = str(bronhouder)
     url = f'https://publiek.broservices.nl/gm/gmw/v1/bro-ids?bronhouder={bronhouder}'
-    response = requests.get(url)
+    response = _session.get(url, timeout=TIMEOUT)
     response_status_code = response.status_code
     return response.json()['broIds']
+
+
+def get_many(func, ids, max_workers=MAX_WORKERS, **kwargs):
+    """Call BRO request function for a list of ids simultaneously.
+
+    Parameters
+    ----------
+    func : function
+        Function in this module with BRO id as first argument 
+        (i.e. get_welltubes, get_wellprops or get_levels).
+    ids : list of str
+        Valid BRO ids.
+    max_workers : int, default MAX_WORKERS
+        Maximum number of simultaneous requests.
+    **kwargs
+        Keyword arguments passed to func.
+
+    Returns
+    -------
+    list
+        Results of func in the same order as ids.
+    """
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        return list(executor.map(lambda x: func(x, **kwargs), ids))
@@ -10,10 +10,13 @@
 
 import os
 import os.path
+import re
+import functools
 from datetime import datetime
 from collections import OrderedDict
 import csv
 import time
+from io import StringIO
 import datetime as dt
 import warnings
 import numpy as np
@@ -21,15 +24,81 @@ from pandas import Series, DataFrame
 import pandas as pd
 
 sep = ","
+_DINO_DATE_FMT = "%d-%m-%Y"
+_DINO_FN_RE = re.compile(r'(.{11})_1')
+_DATAFIELDS = 11 # number of fields in DinoGws.DATATAG
+
+def _datatext_from_split(lines, columns):
+    """Return text table of measurement lines split in Python, the
+    last column keeps the separators of all remaining fields"""
+    ncols = len(columns)
+    data = [line[:-1].split(sep,ncols-1) for line in lines]
+    data = [row+['']*(ncols-len(row)) for row in data]
+    return DataFrame(data, columns=columns)
+
+def _datatext_from_csv(lines, columns):
+    """Return text table of measurement lines parsed by the pandas C
+    parser, or None when a line has more fields than DinoGws.DATATAG
+
+    The result equals the result of _datatext_from_split()."""
+    text = ''.join(lines)
+    names = list(range(_DATAFIELDS))
+    try:
+        with warnings.catch_warnings():
+            # surplus fields are dropped with a warning, they are
+            # detected by counting separators below
+            warnings.simplefilter('ignore', pd.errors.ParserWarning)
+            tb = pd.read_csv(StringIO(text), sep=sep, header=None, 
+                names=names, index_col=False, dtype=str, na_filter=False,
+                quoting=csv.QUOTE_NONE, skip_blank_lines=False)
+    except pd.errors.ParserError:
+        return None
+
+    # each parsed field after the first was preceded by a separator
+    nseps = (tb.notna().sum(axis=1)-1).clip(lower=0).sum()
+    if nseps!=text.count(sep):
+        return None
+
+    # missing fields of short lines are NaN, empty fields are empty
+    # strings; fields after the remark are joined to the remark
+    ncols = len(columns)
+    remarks = tb[ncols-1]
+    for col in range(ncols,_DATAFIELDS):
+        remarks = remarks.where(tb[col].isna(), remarks+sep+tb[col])
+
+    datatext = tb[names[:ncols-1]].fillna('')
+    datatext.columns = columns[:-1]
+    datatext[columns[-1]] = remarks.fillna('')
+    return datatext
 
 def filesfromdir(dir):
     """Return list of dino sourcefiles from directory """
 
     filenames = []
     seriesnames = []
-    for root, dirs, files in os.walk(dir):
-        seriesnames += [f[0:11] for f in files if f[11:13]=="_1"]
-        filenames += [os.path.join(root, f) for f in files if f[11:13]=="_1"]
+    try:
+        entries = os.scandir(dir)
+    except (FileNotFoundError, NotADirectoryError):
+        # like os.walk, a missing directory has no files
+        return filenames, seriesnames
+
+    with entries:
+        subdirs = []
+        for entry in entries:
+            if entry.is_dir():
+                if not entry.is_symlink():
+                    subdirs.append(entry.path)
+                continue
+            match = _DINO_FN_RE.match(entry.name)
+            if match:
+                seriesnames.append(match.group(1))
+                filenames.append(os.path.join(dir, entry.name))
+
+    # search subdirectories after files, like os.walk
+    for subdir in subdirs:
+        subfiles, subnames = filesfromdir(subdir)
+        filenames += subfiles
+        seriesnames += subnames
     return filenames, seriesnames
     
 
@@ -187,6 +256,10 @@ class DinoGws:
         else:
             self._data = DataFrame()
 
+        # data has changed, remove cached properties
+        self.__dict__.pop('headdata', None)
+        self.dfdesc = DataFrame()
+
         return self._header, self._data
 
 
@@ -198,42 +271,46 @@ class DinoGws:
         self.headerend = 0
         self.datastart = 0
 
-        # find variables
-        for il in range(len(self.flines)):
+        # find variables, each line is visited only once
+        lines = self.flines
+        nlines = len(lines)
+        il = 0
+        while il < nlines:
+            line = lines[il]
 
-            if self.flines[il].startswith(self.MISSINGDATA):
+            if line.startswith(self.MISSINGDATA):
                 # put zonder gegevens
                 self.errors.append([self.filepath,"Bestand bevat geen data"])
                 self.hasheader = False
                 self.hasdata = False
                 break
 
-            if self.flines[il].startswith(self.METATAG): #("Locatie,Filternummer,Externe"):
-                if not self.flines[il+1].startswith("B"): # er zijn geen headerlines onder de headerkop
-                    self.hasheader = False
-                    self.errors.append([self.filepath,"Bestand zonder header"])                               
-                else:
-                    while True:
+            if line.startswith(self.METATAG): #("Locatie,Filternummer,Externe"):
+                il+=1
+                if il<nlines and lines[il].startswith("B"):
+                    self.hasheader = True
+                    self.headerstart = il
+                    while il<nlines and lines[il].startswith("B"):
                         il+=1
-                        if self.flines[il].startswith("B"):
-                            if self.headerstart==0:
-                                self.hasheader = True                        
-                                self.headerstart = il
-                        else: #voorbij laatste regel header
-                            self.headerend = il
-                            break
-                            
-            if self.flines[il].startswith(self.DATATAG):
+                    #voorbij laatste regel header
+                    self.headerend = il
+                else: # er zijn geen headerlines onder de headerkop
+                    self.hasheader = False
+                    self.errors.append([self.filepath,"Bestand zonder header"])
+                continue # line il is not part of header
+
+            if line.startswith(self.DATATAG):
                 # bepaal eerste regelnummer met data
                 il+=1
-                if self.flines[il].startswith("B"):
+                if il<nlines and lines[il].startswith("B"):
                     self.hasdata = True
                     self.datastart = il
                 else:
                     self.hasdata = False
                     self.errors.append([self.filepath,"Bestand zonder grondwaterstanden"])
                 break
-        il+=1
+
+            il+=1
         # end of def findlines
         return self.headerstart, self.headerend, self.datastart
 
@@ -243,8 +320,8 @@ class DinoGws:
             if datestring!="":                
                 # string to datetime.datetime object
                 if addtime==True: date = datetime.strptime(
-                    datestring+" 12:00", "%d-%m-%Y %H:%M")
-                else: date = datetime.strptime(datestring, "%d-%m-%Y")                    
+                    datestring+" 12:00", _DINO_DATE_FMT+" %H:%M")
+                else: date = datetime.strptime(datestring, _DINO_DATE_FMT)
             else:
                 date = np.NaN
         else:
@@ -257,14 +334,14 @@ class DinoGws:
         if self.headerstart>0 and self.headerend > self.headerstart:
             # create _header
             headerlist = [line[:-1].split(sep) for line in self.flines[self.headerstart:self.headerend]]
-            self._header = DataFrame(headerlist, columns=self.FILTERCOLS)
             self._headertext = DataFrame(headerlist, columns=self.FILTERCOLS)
+            self._header = self._headertext.copy()
 
             # transform column values
-            self._header["filter"] = self._header["filter"].apply(lambda x: x.lstrip("0"))
-            self._header["mvdatum"] = self._header["mvdatum"].apply(lambda x:self.parse_dino_date(x))
-            self._header["startdatum"] = self._header["startdatum"].apply(lambda x:self.parse_dino_date(x))
-            self._header["einddatum"] = self._header["einddatum"].apply(lambda x:self.parse_dino_date(x))
+            self._header["filter"] = self._header["filter"].str.lstrip("0")
+            for col in ["mvdatum","startdatum","einddatum"]:
+                self._header[col] = pd.to_datetime(self._header[col], 
+                    format=_DINO_DATE_FMT, cache=True, errors='coerce')
 
         else:
             # create empty dataframe
@@ -278,35 +355,27 @@ class DinoGws:
     def _readgws(self):
         """ Read groundwater measurements to pandas data frame """
 
-        def fstr2float(astr):
-            try:
-                aval = float(astr)
-            except ValueError:
-                aval = np.NaN
-            return aval
-
-
         if self.datastart>0:
 
-            # create list of data from filelines
-            data = [line[:-1].split(sep)[0:7]+[sep.join(line[:-1].split(
-                sep)[7:])] for line in self.flines[self.datastart:]]            
-            self._datatext = DataFrame(data, columns=self.DATACOLS)
-            self._data = DataFrame(data, columns=self.DATACOLS)
-
-            # transform column values
-            self._data["peildatum"] = self._data["peildatum"].apply(
-                lambda x:datetime.strptime(x,"%d-%m-%Y"))  # 28-03-1958
-            self._data["filter"] = self._data["filter"].apply(
-                lambda x: x.lstrip("0"))
-            self._data["standcmmp"] = self._data["standcmmp"].apply(
-                lambda x: fstr2float(x))
-            self._data["standcmmv"] = self._data["standcmmv"].apply(
-                lambda x: fstr2float(x))
-            self._data["standcmnap"] = self._data["standcmnap"].apply(
-                lambda x: fstr2float(x))
-            self._data["opmerking"] = self._data["opmerking"].apply(
-                lambda x: x.strip(","))
+            # the pandas C parser reads all lines as text at once,
+            # lines with separators in remarks are split in Python
+            lines = self.flines[self.datastart:]
+            self._datatext = _datatext_from_csv(lines, self.DATACOLS)
+            if self._datatext is None:
+                self._datatext = _datatext_from_split(lines, 
+                    self.DATACOLS)
+            self._data = self._datatext.copy()
+
+            # transform column values with vectorized string and
+            # numeric conversions
+            self._data["peildatum"] = pd.to_datetime(
+                self._data["peildatum"], format=_DINO_DATE_FMT, 
+                cache=True, errors='coerce') # 28-03-1958
+            self._data["filter"] = self._data["filter"].str.lstrip("0")
+            for col in ["standcmmp","standcmmv","standcmnap"]:
+                self._data[col] = pd.to_numeric(self._data[col], 
+                    errors='coerce')
+            self._data["opmerking"] = self._data["opmerking"].str.strip(",")
 
         else:
             self._data = DataFrame(columns=self.DATACOLS)
@@ -340,9 +409,12 @@ class DinoGws:
         return self.srseries
 
 
-    @property
+    @functools.cached_property
     def headdata(self):
-        """Return head data fromdino csv file"""
+        """Return head data fromdino csv file
+
+        The table is created once and shared by all callers, do not 
+        change it in place."""
         if len(self._data)>0:
             data = self._data[self.HEADCOLS].copy()
         else:
@@ -396,7 +468,7 @@ class DinoGws:
             filcols = ['reeksnaam', 'nitgcode', 'filter', 'tnocode', 'xcoor', 'ycoor','mvcmnap', 'mvdatum', 'startdatum', 'einddatum', 'mpcmnap', 'mpcmmv','filtopcmnap', 'filbotcmnap']
             self.dfdesc = DataFrame(columns=filcols)
 
-            if len(self._readheader()) !=0 and len(self._readgws())!=0:
+            if len(self._header) !=0 and len(self._data)!=0:
 
                 # make one line of metadata
                 dftail = self.header.tail(1).copy()
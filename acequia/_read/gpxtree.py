@@ -4,6 +4,7 @@ Supports GPX v1.0 and v1.1
 """
 
 from pathlib import Path
+import numpy as np
 from pandas import DataFrame, Series
 import pandas as pd
 from lxml import etree
@@ -96,55 +97,70 @@ class GpxTree:
                         self._meta[key] = value
         return self._meta
 
+    def _add_point(self, columns, nrows, point, props=None):
+        """Add attributes lat/lon and child node values of point node 
+        to dict with a list of values for each column."""
+        values = dict(props) if props else {}
+        values['lat'] = point.attrib['lat']
+        values['lon'] = point.attrib['lon']
+        for child in point.iterchildren():
+            key = child.tag.split('}')[1] #drop namespace
+            values[key] = child.text
+
+        for key,value in values.items():
+            if key not in columns:
+                # new column, fill previous rows with missing values
+                columns[key] = [np.nan]*nrows
+            columns[key].append(value)
+
+        for column in columns.values():
+            if len(column)==nrows:
+                column.append(np.nan)
+
+    def _to_frame(self, columns):
+        """Return DataFrame from column lists with float coordinates."""
+        for key in ['lat','lon']:
+            if key in columns:
+                columns[key] = np.asarray(columns[key], dtype=np.float64)
+        return DataFrame(columns)
+
     def _get_waypoints(self):
         """Extract waypoints from xml tree."""
 
-        # extract waypoints from tree
-        waypoints = []
-        for wpnode in self._root.findall(f'.//wpt',self._ns):
-            wp = {}
-            wp['lat'] = wpnode.attrib['lat']
-            wp['lon'] = wpnode.attrib['lon']
-            for child in wpnode.iterchildren():
-                key = child.tag.split('}')[1] #drop namespace
-                wp[key] = child.text
-            waypoints.append(wp)
+        # collect values in lists per column, not in dicts per row
+        columns = {}
+        nrows = 0
+        for wpnode in self._root.iterfind(f'.//wpt',self._ns):
+            self._add_point(columns, nrows, wpnode)
+            nrows+=1
 
-        return DataFrame(waypoints)
+        return self._to_frame(columns)
 
 
     def _get_trackpoints(self):
         """Extract trackpoints from xml tree."""
 
+        # collect values in lists per column, not in dicts per row
+        columns = {}
+        nrows = 0
+
         # iterate over track nodes
-        trackpoints = []
-        for tracknode in self._root.findall(f'.//trk',self._ns):
+        for tracknode in self._root.iterfind(f'.//trk',self._ns):
             trackname = tracknode.find(f'.//name',self._ns).text
 
             # iterate over track segments
-            for tracksegment in tracknode.findall(f'.//trkseg',self._ns):
-                segmentid = 0
+            segmentid = 0
+            for tracksegment in tracknode.iterfind(f'.//trkseg',self._ns):
+                props = {'trackname':trackname, 'segmentid':str(segmentid)}
 
                 # iterate over segment trackpoints 
                 for trackpoint in tracksegment.iterchildren():
-                    tp = {}
-                    tp['trackname'] = trackname
-                    tp['segmentid'] = str(segmentid)
-                    
-                    # attribute of trackpoint
-                    tp['lat'] = trackpoint.attrib['lat']
-                    tp['lon'] = trackpoint.attrib['lon']
-                    
-                    # children of trackpoint
-                    for child in trackpoint.iterchildren():
-                        key = child.tag.split('}')[1] #drop namespace
-                        tp[key] = child.text
-
-                    trackpoints.append(tp)
+                    self._add_point(columns, nrows, trackpoint, props)
+                    nrows+=1
 
                 segmentid+=1
 
-        return DataFrame(trackpoints)
+        return self._to_frame(columns)
 
     @property
     def meta(self):
@@ -153,13 +169,23 @@ class GpxTree:
 
     @property
     def bounds(self):
-        """Return boundary of tracklog as Dict."""
+        """Return boundary of tracklog as Dict.
+
+        Bounds are taken from the gpx bounds node. When this node is 
+        missing, bounds are calculated from the trackpoints."""
         bounds_node = self._root.find(f'.//bounds',self._ns)
-        try:
-            return bounds_node.attrib
-        except AttributeError as err:
+        if bounds_node is not None:
+            return {key:float(bounds_node.attrib[key]) for key in 
+                ['minlat','minlon','maxlat','maxlon']}
+
+        trackpoints = self._get_trackpoints()
+        if trackpoints.empty:
             return {'minlat':None, 'minlon':None, 'maxlat':None,'maxlon':None}
-        return ''
+
+        lat = trackpoints['lat'].to_numpy()
+        lon = trackpoints['lon'].to_numpy()
+        return {'minlat':lat.min(), 'minlon':lon.min(), 
+            'maxlat':lat.max(), 'maxlon':lon.max()}
 
     @property
     def trackpoints(self):
@@ -0,0 +1,78 @@
+"""
+Module with requests sessions shared by the web service readers.
+
+Responses are only cached on request: with environment variable
+ACEQUIA_HTTP_CACHE set to 1 or with enable_cache() in the reader
+modules. Caching requires package requests_cache.
+"""
+import os
+import warnings
+import requests
+from requests.adapters import HTTPAdapter
+
+CACHE_ENV = 'ACEQUIA_HTTP_CACHE' # set to 1 to cache web service responses
+
+def cache_requested():
+    """Return True if environment variable CACHE_ENV asks for caching
+    of web service responses."""
+    return os.environ.get(CACHE_ENV, '').lower() in ['1','true','yes']
+
+def create_session(retry, pool_connections=1, pool_maxsize=10,
+    cache=False, cache_name=None, cache_dir=None, expire_after=86400,
+    allowable_methods=('GET',)):
+    """Return requests session with connection pool and retries.
+
+    Parameters
+    ----------
+    retry : urllib3.util.retry.Retry
+        Retry strategy for failed requests.
+    pool_connections : int, default 1
+        Number of connection pools (one for each host).
+    pool_maxsize : int, default 10
+        Number of connections kept for reuse in each pool.
+    cache : bool, default False
+        Cache responses in sqlite database cache_name in the user
+        cache directory for expire_after seconds.
+    cache_name : str, optional
+        Name of the cache database.
+    cache_dir : str, optional
+        Directory of the cache database instead of the user cache
+        directory.
+    expire_after : int, default 86400
+        Seconds before cached responses expire.
+    allowable_methods : tuple, default ('GET',)
+        Request methods with cached responses.
+
+    Returns
+    -------
+    requests.Session, requests_cache.CachedSession
+    """
+    session = None
+    if cache:
+        try:
+            import requests_cache
+        except ImportError:
+            warnings.warn((f'Package requests_cache is not installed, '
+                f'web service responses are not cached.'))
+        else:
+            if cache_dir is not None:
+                os.makedirs(cache_dir, exist_ok=True)
+                cache_name = os.path.join(cache_dir, cache_name)
+            session = requests_cache.CachedSession(cache_name,
+                backend='sqlite', use_cache_dir=cache_dir is None,
+                expire_after=expire_after, allowable_codes=(200,),
+                allowable_methods=allowable_methods)
+    if session is None:
+        session = requests.Session()
+
+    adapter = HTTPAdapter(pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize, max_retries=retry)
+    session.mount('https://', adapter)
+    return session
+
+def clear_cache(session):
+    """Remove all cached responses of session.
+
+    Does nothing when responses of session are not cached."""
+    if hasattr(session, 'cache'):
+        session.cache.clear()
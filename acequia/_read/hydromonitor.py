@@ -3,6 +3,8 @@ head measurements from a HydroMonitor csv export file
 """
 
 from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import itertools
 import warnings
 import os.path
 import errno
@@ -55,6 +57,9 @@ class HydroMonitor:
     METATAG = 'StartDateTime'
     DATATAG = 'DateTime'
 
+    CHUNKSIZE = 200_000
+    MAX_WORKERS = 8
+
     META_NUMCOLS = ['XCoordinate','YCoordinate','SurfaceLevel',
         'WellTopLevel','FilterTopLevel','FilterBottomLevel',
         'WellBottomLevel',]
@@ -86,6 +91,13 @@ class HydroMonitor:
         # remopve duplicate data
         self.data = self._delete_duplicate_data()
 
+        # row positions of each (loc,fil) combination, so get_series
+        # does not have to compare full columns for every series
+        self._meta_index = self.metadata.groupby(self.idkeys, 
+            sort=False).indices
+        self._data_index = self.data.groupby(self.idkeys, 
+            sort=False).indices
+
         # create generator
         self._srgen = self.data.groupby(self.idkeys).__iter__()
         self._itercount = 0
@@ -243,9 +255,10 @@ class HydroMonitor:
     def _read_data(self):
         """ read data from hydromonitor csv export file """
 
-        #read data
+        # read data in chunks and convert each chunk before reading the
+        # next, so only one chunk of raw text is kept in memory
         colidx = list(range(len(self.data_colnames)))
-        data = pd.read_csv(
+        reader = pd.read_csv(
             self.fpath,
             sep=self.CSVSEP,
             index_col=False,
@@ -256,9 +269,13 @@ class HydroMonitor:
             #parse_dates=['datetime'], # don't, this takes a lot of time
             dtype=str,
             encoding='latin-1',
+            chunksize=self.CHUNKSIZE,
             )
-
-        self._rawdata = data
+        chunks = [self._convert_data(chunk) for chunk in reader]
+        if chunks:
+            data = pd.concat(chunks)
+        else:
+            data = DataFrame(columns=self.data_colnames)
 
         if 'LoggerHead' not in self.data_colnames:
         # when no loggerhead is available, menyanthes only exports
@@ -273,12 +290,6 @@ class HydroMonitor:
             msg = f'Missing data column LoggerHead added and filled with NaNs'
             warnings.warn(msg)
 
-        # convert head columns to numeric
-        for colname in ['LoggerHead','ManualHead']:
-            if colname in self.data_colnames:
-                data[colname] = data[colname].str.replace(',','.')
-                data[colname] = pd.to_numeric(data[colname],errors='coerce')
-
         if 'ManualHead' not in self.data_colnames:
         # this is a variation on the previous missing loggerhead issue
 
@@ -294,19 +305,28 @@ class HydroMonitor:
         if '' in list(data.columns):
             data = data.drop([''], axis=1)
 
+        return data
+
+    def _convert_data(self, data):
+        """Return chunk of raw data with converted column values."""
+
         # delete repeating headers deep down list of data as a result of
         # annoying bugs in menyanthes export module
         namecol = self.data_colnames[0]
         #data = data[data[namecol]!='NITGCode'].copy()
         #data = data[data[namecol]!='Name'].copy()
-        data = data[data[namecol]!=namecol].copy()
-        data = data[data[namecol]!='[String]'].copy()
+        data = data[(data[namecol]!=namecol)&(data[namecol]!='[String]')].copy()
+
+        # convert head columns to numeric
+        for colname in ['LoggerHead','ManualHead']:
+            if colname in self.data_colnames:
+                data[colname] = data[colname].str.replace(',','.')
+                data[colname] = pd.to_numeric(data[colname],errors='coerce')
 
         # parsing these dates is very time consuming
         data['DateTime'] = pd.to_datetime(data['DateTime'],
               dayfirst=True,format='%d-%m-%Y %H:%M',errors='coerce')
 
-
         return data
 
     @property
@@ -354,12 +374,10 @@ class HydroMonitor:
         gws = GwSeries()
         
         # create DataFrame with HydroMonitor metadata for one series
-        bool_loc = self.metadata[self.idkeys[0]]==loc
-        bool_fil = self.metadata[self.idkeys[1]]==fil
-        metadata = self.metadata[bool_loc & bool_fil]
-        if metadata.empty:
+        if (loc,fil) not in self._meta_index:
             raise ValueError((f"Combination of loc='{loc}' and fil='{fil}' "
                 f"not found in HydroMonitor metadata."))
+        metadata = self.metadata.take(self._meta_index[(loc,fil)])
 
         # Metadata can have a new row of metadata for each change.
         # Therefore, metadata can one or mulitple rows. For GwSeries
@@ -369,9 +387,8 @@ class HydroMonitor:
         idx_firstrow = metadata.index[0]
 
         # create DataFrame with Hydromonitor measurements for one series
-        bool_loc = self.data[self.idkeys[0]]==loc
-        bool_fil = self.data[self.idkeys[1]]==fil
-        data = self.data[bool_loc & bool_fil]
+        rows = self._data_index.get((loc,fil), np.array([],dtype=np.intp))
+        data = self.data.take(rows)
 
         # GwSeries tubeprops from HydroMonitor metadata
         for prop in GwSeries.TUBEPROPS_NAMES:
@@ -527,16 +544,30 @@ class HydroMonitor:
     """
 
     def __len__(self):
-        heads = self._delete_duplicate_data()
-        hymlen=0
-        for srname,sr in heads.groupby(self.idkeys).__iter__():
-            hymlen+=1
-        return hymlen
+        return len(self._data_index)
 
-    def to_json(self,filedir=None):
+    def to_json(self,filedir=None,max_workers=MAX_WORKERS):
+        """Save all series to json files in filedir.
 
-        for gw in self.iteritems():
-            gw.to_json(filedir)
+        Parameters
+        ----------
+        filedir : str
+            Directory the json files are written to.
+        max_workers : int, default MAX_WORKERS
+            Maximum number of files written simultaneously.
+        """
+        # series are created and written in batches, so only a few 
+        # GwSeries objects are held in memory at the same time
+        series = self.iteritems()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            while True:
+                batch = list(itertools.islice(series, 2*max_workers))
+                if not batch:
+                    break
+                futures = [executor.submit(gw.to_json, filedir) 
+                    for gw in batch]
+                for future in futures:
+                    future.result() # raises write errors
 
 
     def iteritems(self):
@@ -8,27 +8,114 @@ Example
 
 """
 import os,os.path
+import functools
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from dateutil.relativedelta import relativedelta
 import warnings
 import logging
 import requests
+from urllib3.util.retry import Retry
 import pkgutil
-import pkg_resources
-from io import StringIO
+from importlib import resources
+from io import StringIO, BytesIO
 import warnings
 import numpy as np
+from scipy.spatial import cKDTree
 import pandas as pd
 from pandas import Series, DataFrame
 import pandas as pd
-from shapely.geometry import Point
-from geopandas import GeoSeries
-import geopandas as gpd
-from json import JSONDecodeError
 from .._geo.coordinate_conversion import CrdCon, convert_WGS84toRD
+from . import httpsession
 
 logger = logging.getLogger(__name__)
 
+TIMEOUT = 60 # seconds to wait for KNMI server response
+MAX_WORKERS = 4 # number of simultaneous requests to KNMI server
+POOL_MAXSIZE = 8 # open connections kept for reuse, >= MAX_WORKERS
+CACHE_NAME = 'acequia_knmi_cache' # sqlite file in cache directory
+CACHE_EXPIRE = 86400 # seconds before cached KNMI responses expire
+
+def _create_session(cache=False, cache_dir=None):
+    """Return requests session with connection pool and retries,
+    responses are cached only if cache is True."""
+    retry = Retry(total=3, backoff_factor=0.5, 
+        status_forcelist=[429,500,502,503,504])
+    # weather and precipitation urls share one host, so one pool 
+    # holds all connections that threaded requests can reuse
+    return httpsession.create_session(retry, pool_connections=1,
+        pool_maxsize=POOL_MAXSIZE, cache=cache, cache_name=CACHE_NAME, 
+        cache_dir=cache_dir, expire_after=CACHE_EXPIRE)
+
+# one session for all requests reuses connections to the KNMI server
+_session = _create_session(cache=httpsession.cache_requested())
+
+def enable_cache(enable=True, cache_dir=None):
+    """Cache KNMI server responses for CACHE_EXPIRE seconds.
+
+    Responses are stored in a sqlite database in directory cache_dir,
+    or in the user cache directory when cache_dir is not given. 
+    Requires package requests_cache. Use enable=False to return to 
+    requests without cache."""
+    global _session
+    _session = _create_session(cache=enable, cache_dir=cache_dir)
+
+def session():
+    """Return requests session shared by all KnmiDownload objects."""
+    return _session
+
+def clear_cache():
+    """Remove all cached KNMI server responses.
+
+    Does nothing when responses are not cached."""
+    httpsession.clear_cache(_session)
+
+@functools.lru_cache(maxsize=4)
+def _read_hydropandas_stations(filename):
+    """Return table of KNMI stations from hydropandas json file.
+
+    The json files are shipped with acequia and never change, so they
+    are read only once per session. Callers get a copy."""
+    with resources.files(__package__).joinpath(filename).open('rb') as stream:
+        stn = pd.read_json(stream, encoding='latin-1')
+
+    stn.index = stn.index.astype('str').str.zfill(3)
+    stn.index.name = 'stn_code'
+    stn = stn.rename(columns={'naam':'stn_name', 'x':'xrd', 'y':'yrd', 'hoogte':'alt_mnap'})
+    stn = stn[['stn_name','xrd','yrd','lat','lon','alt_mnap']].copy()
+    return stn
+
+@functools.lru_cache(maxsize=4)
+def _read_hydropandas_geostations(filename):
+    """Return GeoDataFrame of KNMI stations from hydropandas json file,
+    built only once per session. Callers get a copy."""
+    # geopandas is slow to import, import only when needed
+    import geopandas as gpd
+    stns = _read_hydropandas_stations(filename).copy()
+    stns['label'] = stns.index + '_' + stns['stn_name']
+    stns = gpd.GeoDataFrame(
+        stns, geometry=gpd.points_from_xy(stns.xrd, stns.yrd))
+    return stns.set_crs('epsg:28992')
+
+@functools.lru_cache(maxsize=4)
+def _read_hydropandas_stationtree(filename):
+    """Return KD-tree of station coordinates in Dutch grid from 
+    hydropandas json file, built only once per session. Tree positions
+    are row positions in the table of _read_hydropandas_stations()."""
+    stns = _read_hydropandas_stations(filename)
+    return cKDTree(stns[['xrd','yrd']].to_numpy(dtype=np.float64))
+
+@functools.lru_cache(maxsize=4)
+def _read_hydropandas_stationcodes(filename):
+    """Return dict of KNMI station codes by station name from 
+    hydropandas json file. For duplicate names the first code in the 
+    table is kept."""
+    stns = _read_hydropandas_stations(filename)
+    names = stns['stn_name'].values[::-1]
+    codes = stns.index.values[::-1]
+    return dict(zip(names, codes))
+
+
 
 def get_knmi_weatherstations(geo=True):
     """ Return list of KNMI weather stations.
@@ -194,7 +281,8 @@ class KnmiDownload:
                 'fmt':'json'}
 
         # make actual request to knmi server
-        self._response = requests.get(self.WEATHER_URL,params=par) 
+        self._response = _session.get(self.WEATHER_URL,params=par,
+            timeout=TIMEOUT)
         self._response_code = self._response.status_code
         self._response_url = self._response.url
         return self._response
@@ -210,7 +298,8 @@ class KnmiDownload:
                 'fmt':'json'}
 
         # make actual request to knmi server
-        self._response = requests.get(self.PRECIPITATION_URL,params=par)
+        self._response = _session.get(self.PRECIPITATION_URL,params=par,
+            timeout=TIMEOUT)
         self._response_code = self._response.status_code
         self._response_url = self._response.url
         return self._response
@@ -283,13 +372,13 @@ class KnmiDownload:
         # parse server response
         data = self._response.text
         if fmt=='json':
-            # parse result tp json
+            # parse json records column wise with the pandas json reader
             try:
-                data = self._response.json()
-                data = DataFrame(data)
-            except JSONDecodeError as err:
-                raise JSONDecodeError((f'Response could not be serialised '
-                    f'with request  {self._response_url}.'))
+                data = pd.read_json(BytesIO(self._response.content),
+                    orient='records', convert_dates=False)
+            except ValueError as err:
+                raise ValueError((f'Response could not be serialised '
+                    f'with request  {self._response_url}.')) from err
 
         return data
 
@@ -317,14 +406,10 @@ class KnmiDownload:
         pandas DataFrame, geopandas GeoDataframe
             
         """
-        stns = self._wtrstn_hydropandas
-
         if geo:
-            stns['label'] = stns.index + '_' + stns['stn_name']
-            stns = gpd.GeoDataFrame(
-                stns, geometry=gpd.points_from_xy(stns.xrd, stns.yrd))
-            stns = stns.set_crs('epsg:28992')
-        return stns
+            return _read_hydropandas_geostations(
+                'hydropandas_knmi_meteostation.json').copy()
+        return self._wtrstn_hydropandas
 
     def get_precipitation_stations(self, geo=False):
         """Return table of KNMI precipitation stations.
@@ -339,15 +424,10 @@ class KnmiDownload:
         pandas DataFrame, geopandas GeoDataframe
             
         """
-        stns = self._prcstn_hydropandas
         if geo:
-            stns['label'] = stns.index + '_' + stns['stn_name']
-            stns = gpd.GeoDataFrame(stns, 
-                geometry=gpd.points_from_xy(stns.xrd, stns.yrd))
-            stns = stns.set_crs('epsg:28992')
-        else:
-            pass
-        return stns
+            return _read_hydropandas_geostations(
+                'hydropandas_knmi_neerslagstation.json').copy()
+        return self._prcstn_hydropandas
 
 
     def get_precipitation(self, station=None, name=None, start=None, 
@@ -485,6 +565,45 @@ class KnmiDownload:
         return evap
 
 
+    def get_many(self, method='get_precipitation', stations=None, 
+        max_workers=MAX_WORKERS, **kwargs):
+        """Download data for a list of stations simultaneously.
+
+        Parameters
+        ----------
+        method : {'get_precipitation','get_evaporation','get_weather'}
+            Name of KnmiDownload method to call for each station.
+        stations : list of str
+            Valid KNMI station codes.
+        max_workers : int, default MAX_WORKERS
+            Maximum number of simultaneous requests.
+        **kwargs
+            Keyword arguments passed to method (i.e. start, end).
+
+        Returns
+        -------
+        dict
+            Results of method with station codes as keys.
+
+        Example
+        -------
+        >>> data = knmi.get_many('get_precipitation', ['327','550'])
+        """
+        if method not in ['get_precipitation','get_evaporation','get_weather']:
+            raise ValueError(f'Invalid KnmiDownload method {method}.')
+
+        if stations is None:
+            raise ValueError('A list of KNMI station codes is required.')
+
+        # each call uses its own KnmiDownload object, because the server
+        # response is stored on the object and calls run in threads
+        def download(station):
+            return getattr(KnmiDownload(), method)(station=station, **kwargs)
+
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            results = list(executor.map(download, stations))
+        return dict(zip(stations, results))
+
     def get_station_code(self, name=None, kind='precipitation'):
         """Return code of KNMI station with given name.
         Return None if name is not a valid KNMI station name.
@@ -503,23 +622,17 @@ class KnmiDownload:
         """
 
         if kind=='precipitation':
-            stns = self.get_precipitation_stations(geo=False)
-            kindname = 'precipitation'
+            codes = _read_hydropandas_stationcodes(
+                'hydropandas_knmi_neerslagstation.json')
         elif kind=='weather':
-            stns = self.get_weather_stations(geo=False)
-            kindname = 'weather'
+            codes = _read_hydropandas_stationcodes(
+                'hydropandas_knmi_meteostation.json')
         else:
             raise ValueError((f'{kind} is not a valid KNMI sation type.'))
 
-        station = stns[stns['stn_name']==name]
-        if not station.empty:
-            stn = station.index[0]
-        else:
-            ##raise ValueError((f'{name} is not a valid KNMI '
-            ##    f'{kindname} station name.'))
-            stn = None
-
-        return stn
+        # name lookup in dict built once per session, returns None
+        # if name is not a valid KNMI station name
+        return codes.get(name)
 
 
     def get_station_metadata(self, stn=None, kind='precipitation'):
@@ -646,48 +759,87 @@ class KnmiDownload:
             Table of KNMI stations with distance from reference point.
             
         """
+        return self.get_distance_batch([{'kind':kind, 'stn':stn, 
+            'name':name, 'xy':xy, 'latlon':latlon}])[0]
 
-        # determine data type : weather or precipitation
-        if kind=='precipitation':
-            stns = self.get_precipitation_stations(geo=True)
-            kindname = 'precipitation'
-            if isinstance(name, str):
-                stn = self.get_station_code(kind='precipitation', name=name)
+    def get_distance_batch(self, queries):
+        """Return tables of distances between KNMI stations and 
+        multiple reference points.
 
-        elif kind=='weather':
-            stns = self.get_weather_stations(geo=True)
-            kindname = 'weather'
-            if isinstance(name, str):
-                stn = self.get_station_code(kind='weather', name=name)
+        Parameters
+        ----------
+        queries : list of dict
+            Keyword arguments of KnmiDownload.get_distance() for each
+            reference point (kind, stn, name, xy or latlon).
 
-        else:
-            raise ValueError((f'{kind} is not a valid KNMI station type.'))
+        Returns
+        -------
+        list of pandas DataFrame
+            Table of KNMI stations with distance for each query.
+
+        Example
+        -------
+        >>> tables = knmi.get_distance_batch([
+                {'kind':'weather', 'stn':'260'},
+                {'kind':'precipitation', 'xy':(202694, 502957)},])
+        """
+        # reference point coordinates by station kind
+        filenames = {}
+        stations = {}
+        points = {}
+        for i, query in enumerate(queries):
+            kind = query.get('kind', 'precipitation')
+            if kind not in stations:
+                filenames[kind] = self._get_distance_filename(kind)
+                stations[kind] = _read_hydropandas_stations(
+                    filenames[kind])
+                points[kind] = []
+            xy = self._get_reference_xy(stations[kind], **query)
+            points[kind].append((i, xy))
+
+        # one tree query for all points of each kind, distances 
+        # to all stations sorted from near to far
+        tables = [None]*len(queries)
+        for kind, stns in stations.items():
+            positions = [i for i,_ in points[kind]]
+            xys = np.array([xy for _,xy in points[kind]], dtype=np.float64)
+            tree = _read_hydropandas_stationtree(filenames[kind])
+            dists, idxs = tree.query(xys, k=len(stns))
+            dists = np.atleast_2d(dists)
+            idxs = np.atleast_2d(idxs)
+
+            # table of station names with distance in km
+            for pos, dist, idx in zip(positions, dists, idxs):
+                tables[pos] = DataFrame(
+                    data={'stn_name':stns['stn_name'].values[idx],
+                          'distance_km':np.round(dist/1000., 0)},
+                    index=stns.index[idx])
+        return tables
+
+    def _get_distance_filename(self, kind):
+        """Return name of station file of given kind for distance 
+        queries."""
+        if kind=='precipitation':
+            return 'hydropandas_knmi_neerslagstation.json'
+        if kind=='weather':
+            return 'hydropandas_knmi_meteostation.json'
+        raise ValueError((f'{kind} is not a valid KNMI station type.'))
+
+    def _get_reference_xy(self, stns, kind='precipitation', stn=None, 
+        name=None, xy=None, latlon=None):
+        """Return reference point of distance query in Dutch grid."""
+        if isinstance(name, str):
+            stn = self.get_station_code(kind=kind, name=name)
 
         if (stn not in stns.index.values) & (stn is not None):
-            raise ValueError((f'{stn} is not a valid KNMI {kindname} station code.'))
+            raise ValueError((f'{stn} is not a valid KNMI {kind} station code.'))
 
-        # get reference point coordinates as GeoSeries
+        # get reference point coordinates in Dutch grid
         if stn:
-            loc = stns.loc[stn,'geometry']
+            xy = stns.loc[stn,['xrd','yrd']].values
         if latlon:
             xy = convert_WGS84toRD(latlon[0],latlon[1])
-        if xy:
-            # exapend point to geoseries with index equal to stn
-            # because geopandas .distance() method is index based
-            data = [Point(xy[0], xy[1]) for x in range(len(stns))]
-            index = stns.index
-            loc = GeoSeries(data=data, index=index, crs='epsg:28992')
-
-        # calculate distance in km to reference point for each station
-        dist = stns.distance(loc)
-        dist = (dist/1000.).round(0)
-        dist.name = 'distance_km'
-
-        # merge station names with calculated distance
-        stns = pd.merge(stns[['stn_name']], dist, left_index=True, right_index=True, how='left')
-        stns = stns.sort_values('distance_km')
-        
-        return stns
+        return np.asarray(xy, dtype=np.float64)
 
     def replace_missing_values(self, meteo=None, kind='precipitation', fill_backward=False):
         """Replace missing values in a series of precipitation values.
@@ -718,85 +870,97 @@ class KnmiDownload:
         if nandates.empty: # no missing values
             return meteo.copy(), DataFrame()
 
-        first_nan_date = nandates[0]
-        last_nan_date = nandates[-1]
-
         # get codes of replecement stations
         dist = self.get_distance(kind=kind, stn=meteo.name)
         stn_codes = dist[dist['distance_km']!=0].index.values
 
+        if kind not in ['weather','precipitation']:
+            raise ValueError(f'Unknown knmi station kind {kind}.')
+
+        # download replacement series from the nearest stations in 
+        # batches of simultaneous requests; results are used in order 
+        # of distance, so replacements equal those of sequential 
+        # downloads
+        newmeteo = meteo.copy()
+        self._nan_replacements = DataFrame()
         data = []
-        for i,stn in enumerate(stn_codes):
-            try:
-                if kind=='precipitation':
-                    sr = self.get_precipitation(kind=kind, station=stn, 
-                        start=first_nan_date, end=last_nan_date, 
-                        fillnans=False)
-                elif kind=='weather':
-                    sr = self.get_evaporation(station=stn, 
-                        start=first_nan_date, end=last_nan_date,
-                        fillnans=False)
-                else:
-                    raise ValueError(f'Unknown knmi station kind {kind} for station {stn}.')
-                sr = sr[nandates]
-            except KeyError:
-                # not all nandates are in index of sr (non-overlapping time series)
-                # nans can not be replaced with data from station stn, 
-                # so go to next replacement station
-                continue
-            else:
-                if not sr[~sr.isnull()].empty:
-                    data.append(sr)
-                if len(data)>=self.MINIMAL_REPLACEMENTS: # at least three new series
-                    self._nan_replacements = pd.concat(data, axis=1)                
-                    self._nan_replacements['mean'] = self._nan_replacements.mean(axis=1).round(0)
-                    self._nan_replacements['n'] = self._nan_replacements.count(axis=1)-1
-                    newmeteo = meteo.copy()
-                    newmeteo[self._nan_replacements.index] = self._nan_replacements['mean']
-
-                    no_nans_left = self._nan_replacements[self._nan_replacements['mean'].isnull()].empty
-                    enough_values = np.all(self._nan_replacements['n']>=self.MINIMAL_REPLACEMENTS)
-                    if no_nans_left & enough_values:
-                        break
+        batchsize = self.MINIMAL_REPLACEMENTS
+        with ThreadPoolExecutor(max_workers=batchsize) as executor:
+            for first in range(0, len(stn_codes), batchsize):
+                batch = stn_codes[first:first+batchsize]
+                results = executor.map(
+                    lambda stn: self._get_replacement(stn=stn, kind=kind,
+                        nandates=nandates), batch)
+                done = False
+                for sr in results:
+                    if sr is None:
+                        continue
+                    if sr.notna().any():
+                        data.append(sr)
+                    if len(data)>=self.MINIMAL_REPLACEMENTS: # at least three new series
+                        replacements = pd.concat(data, axis=1)
+                        count = replacements.count(axis=1)
+                        replacements['mean'] = replacements.mean(axis=1).round(0)
+                        replacements['n'] = count
+                        self._nan_replacements = replacements
+                        newmeteo = meteo.copy()
+                        newmeteo[replacements.index] = replacements['mean']
+
+                        no_nans_left = replacements['mean'].notna().all()
+                        enough_values = np.all(count>=self.MINIMAL_REPLACEMENTS)
+                        if no_nans_left & enough_values:
+                            done = True
+                            break
+                if done:
+                    break
 
-        
         newmeteo = newmeteo.asfreq('D', method=None, how=None, normalize=True, fill_value=None)
         return newmeteo, self._nan_replacements
 
 
+    @staticmethod
+    def _get_replacement(stn=None, kind='precipitation', nandates=None):
+        """Return values of station stn on nandates or None when station
+        stn has no data for all nandates."""
+
+        # each call uses its own KnmiDownload object, because the server
+        # response is stored on the object and calls run in threads
+        knmi = KnmiDownload()
+        start = nandates[0]
+        end = nandates[-1]
+        try:
+            if kind=='precipitation':
+                sr = knmi.get_precipitation(kind=kind, station=stn, 
+                    start=start, end=end, fillnans=False)
+            else:
+                sr = knmi.get_evaporation(station=stn, start=start, 
+                    end=end, fillnans=False)
+            sr = sr[nandates]
+        except KeyError:
+            # not all nandates are in index of sr (non-overlapping time series)
+            # nans can not be replaced with data from station stn
+            return None
+        return sr
+
     @property
     def _prcstn_hydropandas (self):
         """Return knmi precipitation station coordinates from hydropandas json file."""
-        stream = pkg_resources.resource_stream(__name__, 'hydropandas_knmi_neerslagstation.json')
-        stn = pd.read_json(stream, encoding='latin-1')
-        
-        stn.index = stn.index.astype('str').str.zfill(3)
-        stn.index.name = 'stn_code'
-        stn = stn.rename(columns={'naam':'stn_name', 'x':'xrd', 'y':'yrd', 'hoogte':'alt_mnap'})
-        stn = stn[['stn_name','xrd','yrd','lat','lon','alt_mnap']].copy()
-        return stn
+        return _read_hydropandas_stations(
+            'hydropandas_knmi_neerslagstation.json').copy()
 
     @property
     def _wtrstn_hydropandas(self):
-        """Return knmi precipitation station coordinates from hydropandas json file."""
-        stream = pkg_resources.resource_stream(__name__, 'hydropandas_knmi_meteostation.json')
-        stn =  pd.read_json(stream, encoding='latin-1')
-
-        stn.index = stn.index.astype('str').str.zfill(3)
-        stn.index.name = 'stn_code'
-        stn = stn.rename(columns={'naam':'stn_name', 'x':'xrd', 'y':'yrd', 'hoogte':'alt_mnap'})
-        stn = stn[['stn_name','xrd','yrd','lat','lon','alt_mnap']].copy()
-        return stn
+        """Return knmi weather station coordinates from hydropandas json file."""
+        return _read_hydropandas_stations(
+            'hydropandas_knmi_meteostation.json').copy()
 
     @property
     def _prcstn_acequia(self):
         """Return knmi precipitation station coordinates from acequia csv file."""
 
-        # "stream" is a stream-like object. If you want the actual info, call
-        # stream.read()
         fpath = 'knmi_precipitation_coords.csv'
-        stream = pkg_resources.resource_stream(__name__, fpath)
-        stns =  pd.read_csv(stream, encoding='latin-1')
+        with resources.files(__package__).joinpath(fpath).open('rb') as stream:
+            stns =  pd.read_csv(stream, encoding='latin-1')
 
         stns['stn_code'] = stns['stn_code'].astype('str').str.zfill(3)
         stns = stns.set_index('stn_code')
@@ -812,8 +976,8 @@ class KnmiDownload:
         Coordinates of precipitation stations are not available on the
         KNMI website.
         """
-        #if self._precstns is not None: # were downloaded earlier
-        #    return self._precstns 
+        if self._precstns is not None: # were downloaded earlier
+            return self._precstns.copy()
         
         # request precipitation data for one day to get header data 
         # with all station names
@@ -845,14 +1009,15 @@ class KnmiDownload:
             prec_stn.append(rec)
 
         precstns = DataFrame(prec_stn).set_index('stn_code')
-        return precstns.sort_values(by='stn_name')
+        self._precstns = precstns.sort_values(by='stn_name')
+        return self._precstns.copy()
         
     @property
     def _wtrstn_knmidownload(self):
         """Return table of all available KNMI weather stations from knmi site."""
 
-        #if self._wtrstns is not None: # stations were downloaded earlier
-        #    return self._wtrstns
+        if self._wtrstns is not None: # stations were downloaded earlier
+            return self._wtrstns.copy()
 
         # download metadata for all weather stationa
         dummydate = f'{str(datetime.now().year)}0101'
@@ -889,7 +1054,8 @@ class KnmiDownload:
         wtr_stns.insert(loc=1, column='xrd', value=np.round(x,0))
         wtr_stns.insert(loc=2, column='yrd', value=np.round(y,0))
 
-        return wtr_stns.sort_values(by='stn_name')
+        self._wtrstns = wtr_stns.sort_values(by='stn_name')
+        return self._wtrstns.copy()
 
     @property
     def duplicate_station_codes(self):
@@ -67,14 +67,12 @@ class KnmiRain:
 
     def _readfile(self,fpath):
 
-        # read csv to pd.DataFrame with only str values
+        # read csv to pd.DataFrame with only str values, the csv reader
+        # strips the leading spaces and turns empty values into NaN
         rawdata = pd.read_csv(fpath,sep=',',
             skiprows=self.SKIPROWS,
-            names=self.COLNAMES,dtype='str')
-
-        # replace empty strings with NaN
-        rawdata = rawdata.apply(
-            lambda x: x.str.strip()).replace('', np.nan)
+            names=self.COLNAMES,dtype='str',
+            skipinitialspace=True)
 
         return rawdata
 
@@ -95,7 +93,7 @@ class KnmiRain:
 
                 # set date as index
                 data[colname] = pd.to_datetime(data[colname],
-                    infer_datetime_format=True)
+                    format='%Y%m%d')
                 data = data.set_index(
                     colname,verify_integrity=True)
                 data.index.name='date'
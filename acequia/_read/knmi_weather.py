@@ -58,14 +58,12 @@ class KnmiWeather:
         # extract column names from file header
         colnames = [x.strip() for x in self.header[-1][2:].split(',')]
 
-        # read data with pandas
+        # read data with pandas, the csv reader strips the leading 
+        # spaces and turns empty values into NaN
         rawdata = pd.read_csv(filepath,sep=',',
             skiprows=self.SKIPROWS,
-            names=colnames,dtype='str')
-
-        # replace empty strings with NaN
-        rawdata = rawdata.apply(
-            lambda x: x.str.strip()).replace('', np.nan)
+            names=colnames,dtype='str',
+            skipinitialspace=True)
 
         return rawdata
 
@@ -77,8 +75,8 @@ class KnmiWeather:
             if colname=='YYYYMMDD':
 
                 # create datetimeindex from string column
-                data[colname] = pd.to_datetime(data[colname], #,format='%Y%m%d')
-                    infer_datetime_format=True)
+                data[colname] = pd.to_datetime(data[colname],
+                    format='%Y%m%d')
                 data = data.set_index(
                     colname,verify_integrity=True)
 
@@ -1,17 +1,26 @@
 
 import re
+import os.path
 import pathlib
+import functools
 import warnings
 import datetime as dt
 import numpy as np
 from pandas import Series,DataFrame
 import pandas as pd
-import geopandas as gpd
-##from shapely.geometry import Point
 from .._core.gwseries import GwSeries
 from .._geo.waypoint_kml import WpKml
 
 
+@functools.lru_cache(maxsize=16)
+def _read_csv(fpath, mtime, sep):
+    """Return table from WaterWeb csv file, memoized on filepath and 
+    file modification time. Callers get a copy."""
+    data = pd.read_csv(fpath, sep=sep, decimal=',', low_memory=False)
+    data.columns = [col.strip() for col in data.columns] # remove space before column names
+    return data
+
+
 class WaterWeb:
     """
     Manage WaterWeb dataset
@@ -121,6 +130,10 @@ class WaterWeb:
 
         self.data = self._clean_raw_data()
 
+        # row positions of each series, so series data can be selected
+        # without comparing the full name column for every call
+        self._index = self.data.groupby(self.NAMECOL, sort=False).indices
+
 
     def __repr__(self):
         return (f'{self._network} (n={self.__len__()})')
@@ -149,8 +162,9 @@ class WaterWeb:
            
         """
         try:
-            data = pd.read_csv(fpath, sep=cls.SEP, decimal=',', low_memory=False)
-            data.columns = [col.strip() for col in data.columns] # remove space before column names
+            # file is read again only when it has changed
+            mtime = os.path.getmtime(fpath)
+            data = _read_csv(fpath, mtime, cls.SEP).copy()
         except FileNotFoundError as err:
             raise FileNotFoundError(f'Invalid filepath for WaterWeb csv file: "{fpath}"')
 
@@ -210,6 +224,11 @@ class WaterWeb:
         return data
 
 
+    def _get_series_data(self, srname):
+        """Return rows of data table for one series."""
+        rows = self._index.get(srname, np.array([], dtype=np.intp))
+        return self.data.take(rows)
+
     @property
     def names(self):
         """Return list of series names"""
@@ -378,7 +397,7 @@ class WaterWeb:
         ------
         pd.Series """
 
-        data = self.data[self.data[self.NAMECOL]==srname]
+        data = self._get_series_data(srname)
         lastrow = data.iloc[-1,:]
 
         sr = Series(
@@ -404,7 +423,7 @@ class WaterWeb:
         -------
         pd.DataFrame """
 
-        data = self.data[self.data[self.NAMECOL]==srname]
+        data = self._get_series_data(srname)
         data = data.drop_duplicates(
             subset=self.TUBEPROPS_COLS,
             keep='first')
@@ -439,7 +458,7 @@ class WaterWeb:
         if ref=='surface':
             col = 'peilmmv'
 
-        data = self.data[self.data[self.NAMECOL]==srname]
+        data = self._get_series_data(srname)
         data = data[[col,'datetime']]
         
         sr = data.set_index('datetime',drop=True).squeeze()
@@ -462,7 +481,7 @@ class WaterWeb:
         -------
         pd.Series """
    
-        levels =self.data[self.data[self.NAMECOL]==srname]
+        levels = self._get_series_data(srname)
         levels = levels[self.LEVELDATA_COLS]
         return levels
 
@@ -564,6 +583,8 @@ class WaterWeb:
         # drop series name columns
         locprops = locprops.drop(columns=['sunsr','name'])
 
+        # geopandas is slow to import, import only when needed
+        import geopandas as gpd
         gdf = gpd.GeoDataFrame(
             locprops, geometry=gpd.points_from_xy(
             locprops['xcr'], locprops['ycr'], crs='EPSG:28992'))
@@ -1,10 +1,32 @@
 """This module contains tools for working with the WaterWeb class"""
 
 from pathlib import Path
+import functools
 import warnings
 import pandas as pd
 from .waterweb import WaterWeb
 
+
+@functools.lru_cache(maxsize=8)
+def _count_measurement_types(signature):
+    """Return table of measurement type counts for the WaterWeb csv 
+    files in signature, a tuple of (filepath, mtime) pairs. Callers 
+    get a copy."""
+
+    # list of series with counts for each network file
+    counts_list = []
+    for fname, mtime in signature:
+        wwn = WaterWeb.from_csv(fname)
+        counts_list.append(wwn.measurement_types)
+
+    # table of measurment type by network names
+    tbl_list = [pd.DataFrame(sr).T for sr in counts_list]
+    tbl = pd.concat(tbl_list).fillna(0)
+    for col in tbl.columns:
+        tbl[col] = tbl[col].astype(int)
+    return tbl
+
+
 def measurement_types(fdir,zeros=True,rowsum=True,colsum=True):
     """
     Return table of measurement types for mutiple networks
@@ -26,27 +48,19 @@ def measurement_types(fdir,zeros=True,rowsum=True,colsum=True):
         table of measurement type counts for all networks
     """
 
-    if not Path(fdir).exists:
+    if not Path(fdir).exists():
         raise ValueError(f'Directory {fdir} does not exist.')
 
-    # list of series with counts for each network file
+    # counts are memoized on the file paths and modification times,
+    # so repeated calls only stat the files in fdir
     pathlist = Path(fdir).glob('**/*')
     filelist = [x for x in pathlist if x.is_file()]
-
-    counts_list = []
-    for fname in filelist:
-        wwn = WaterWeb.from_csv(fname)
-        counts_list.append(wwn.measurement_types)
-
-    # table of measurment type by network names
-    tbl_list = [pd.DataFrame(sr).T for sr in counts_list]
-    tbl = pd.concat(tbl_list).fillna(0)
-    for col in tbl.columns:
-        tbl[col] = tbl[col].astype(int)
+    signature = tuple((str(x), x.stat().st_mtime) for x in filelist)
+    tbl = _count_measurement_types(signature).copy()
 
     # sort column names
-    if not set(tbl.columns) - set(wwn.MEASUREMENT_TYPES):
-        tbl = tbl.reindex(wwn.MEASUREMENT_TYPES, axis=1)
+    if not set(tbl.columns) - set(WaterWeb.MEASUREMENT_TYPES):
+        tbl = tbl.reindex(WaterWeb.MEASUREMENT_TYPES, axis=1)
     else: #tbl2.columns contains names not in _measurement_types
         warnings.warn('Non-standard measurement types found.')
         tbl = tbl.reindex(sorted(tbl.columns), axis=1)
@@ -3,12 +3,24 @@
 
 import os
 import warnings
+from concurrent.futures import ThreadPoolExecutor
 from pandas import Series, DataFrame
 import pandas as pd
 import numpy as np
 
 from .._core.gwlist import GwList
 
+MAX_WORKERS = 4 # number of source files read and described simultaneously
+
+def _series_stats(gw, ref='datum', gxg=False):
+    """Return tuple of series statistics and xg table for GwSeries gw,
+    or None when gw has no tube properties."""
+    if gw._tubeprops.empty:
+        warnings.warn((f'{gw.name()} has no tubeproperties ' 
+            f' and will be ignored.'))
+        return None
+    return gw.describe(ref=ref,gxg=gxg), gw.xg(ref=ref,name=True)
+
 def gwliststats(srcdir=None,ref=None,gxg=False):
     """Return table of decriptive statistics for multiple heads series
 
@@ -93,7 +105,8 @@ class GwListStats:
         gwlist : aq.GwList object, optional
             list of gwseries objects
         srstats : pd.DataFrame
-            table with series statistics as returned by stats() method
+            table with series statistics as returned by srstats() 
+            method, used by locstats() until srstats() is called
 
         Examples
         --------
@@ -106,6 +119,7 @@ class GwListStats:
         self._locs = locs
         self._gwlist = gwlist
         self._srstats = srstats
+        self._scans = {} # (srstats, xg) tables by (ref, gxg)
 
         #if (self._gwlist is None) and (self._srcdir is None):
         #    raise ValueError(
@@ -133,7 +147,7 @@ class GwListStats:
         self._gwlist = GwList(srcdir=self._srcdir,loclist=self._locs)
 
 
-    def srstats(self,ref='datum',gxg=False):
+    def srstats(self,ref='datum',gxg=False,max_workers=MAX_WORKERS):
         """Return series statistics
 
         Parameters
@@ -142,29 +156,49 @@ class GwListStats:
             head reference level
         gxg : bool, default False
             include GxG descriptive statistics
+        max_workers : int, default MAX_WORKERS
+            number of source files read and described simultaneously,
+            use 1 to read files one by one
+
+        Notes
+        -----
+        Source files are always scanned, a table given as parameter 
+        srstats of the constructor is replaced by the result.
         """
 
+        # source files are scanned once for each combination of ref 
+        # and gxg, srstats, xg, locstats and save share the results
+        if (ref,gxg) in self._scans:
+            self._srstats, self._xg = self._scans[(ref,gxg)]
+            return self._srstats.copy()
+
         if self._gwlist is None:
             self._create_list()
 
-        srstats_list = []
-        xg_list = []
-        for i,gw in enumerate(self._gwlist):
+        # separate source files are independent, so they are read
+        # and described by a pool of threads in list order
+        paths = self._gwlist.paths()
+        if (paths is not None) and (max_workers!=1):
+            reader = self._gwlist.from_path
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                results = list(executor.map(
+                    lambda path: _series_stats(reader(path),ref=ref,gxg=gxg),
+                    paths))
+        else:
+            results = [_series_stats(gw,ref=ref,gxg=gxg) 
+                for gw in self._gwlist]
 
-            if not gw._tubeprops.empty:
-                desc = gw.describe(ref=ref,gxg=gxg)
-                srstats_list.append(desc)
-                xg_list.append(gw.xg(ref=ref,name=True))
-            else:
-                warnings.warn((f'{gw.name()} has no tubeproperties ' 
-                    f' and will be ignored.'))
+        results = [x for x in results if x is not None]
+        srstats_list = [desc for desc,xg in results]
+        xg_list = [xg for desc,xg in results]
 
         self._srstats = pd.concat(srstats_list,axis=1).T
         self._srstats.index.name = 'series'
 
         self._xg = pd.concat(xg_list,axis=0)
 
-        return self._srstats
+        self._scans[(ref,gxg)] = (self._srstats, self._xg)
+        return self._srstats.copy()
 
 
     def xg(self):
@@ -173,7 +207,7 @@ class GwListStats:
         if not hasattr(self,'_xg'):
             self.srstats()
 
-        return self._xg
+        return self._xg.copy()
 
 
     def locstats(self):
@@ -95,42 +95,38 @@ class GwTimeStats:
 
         """
 
+        # statistics are collected in a dict and turned into a 
+        # series once, instead of enlarging a series for each value
         heads = self._heads
-        stats = Series(name=self._name,dtype='object')
+        stats = {}
 
         if not heads.empty:
-            stats['firstdate'] = heads.index.min().date()
-            stats['lastdate'] = heads.index.max().date()
-            stats['minyear'] = heads.index.min().year
-            stats['maxyear'] = heads.index.max().year
+            firstdate = heads.index.min()
+            lastdate = heads.index.max()
+            stats['firstdate'] = firstdate.date()
+            stats['lastdate'] = lastdate.date()
+            stats['minyear'] = firstdate.year
+            stats['maxyear'] = lastdate.year
             stats['yearspan'] = stats['maxyear']-stats['minyear']+1
-            stats['nyears'] = len(set(heads.index.year))
+            stats['nyears'] = heads.index.year.nunique()
             stats['maxfrq'] = maxfrq(heads)
             stats['mean'] = round(heads.mean(),2)
-            stats['median'] = round(heads.median(),2)
-            q05 = heads.quantile(q=0.05)
-            q95 = heads.quantile(q=0.95)
+
+            # median and outer quantiles from one sort of the heads
+            q05, median, q95 = heads.quantile(q=[0.05,0.5,0.95])
+            stats['median'] = round(median,2)
             stats['q05'] = round(q05,2)
             stats['q95'] = round(q95,2)
             stats['dq0595'] = round(q95-q05,2)
 
         else:
 
-            stats['firstdate'] = np.nan
-            stats['lastdate'] = np.nan
-            stats['minyear'] = np.nan
-            stats['maxyear'] = np.nan
-            stats['yearspan'] = np.nan
-            stats['nyears'] = np.nan
-            stats['maxfrq'] = np.nan
-            stats['mean'] = np.nan
-            stats['median'] = np.nan
-            q05 = np.nan
-            q95 = np.nan
-            stats['q05'] = np.nan
-            stats['q95'] = np.nan
-            stats['dq0595'] = np.nan
+            for key in ['firstdate','lastdate','minyear','maxyear',
+                'yearspan','nyears','maxfrq','mean','median','q05',
+                'q95','dq0595']:
+                stats[key] = np.nan
 
+        stats = Series(stats,name=self._name,dtype='object')
         self._stats = stats
         return self._stats
 
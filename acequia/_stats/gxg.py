@@ -244,51 +244,53 @@ class GxgStats:
     def _calculate_xg_nap(self):
         """Calculate xg statistics for eacht year and return table""" 
 
+        # 1428 heads with their hydrological year and season, statistics
+        # for all years are calculated with grouped reductions
         hydroyears = hydroyear(self._ts1428)
+        notnull = self._ts1428.notnull().values
+        heads = DataFrame({
+            'head':self._ts1428.values[notnull],
+            'year':hydroyears[notnull],
+            'season':season(self._ts1428)[notnull],
+            })
+
         sr = self._yearseries(hydroyears)
         xg = pd.DataFrame(index=sr.index)
         xg.index.name = 'year'
 
-        for year in xg.index:
-
-            ts = self._ts1428[hydroyears==year]
-            ts = ts[ts.notnull()]
-
-            n1428 = len(ts)
-            if not np.isnan(n1428):
-                n1428 = math.floor(n1428)
-
-            hg3 = np.nan
-            lg3 = np.nan
-
-            if n1428 >= self.N14:
+        # highest and lowest levels only for years with at least N14
+        # measurements
+        n1428 = heads.groupby('year').size().reindex(xg.index,fill_value=0)
+        valid = n1428 >= self.N14
+        winter = heads[heads['season']=='winter']
+        summer = heads[heads['season']=='summer']
 
-                hg3 = ts.nlargest(n=3).mean()
-                lg3 = ts.nsmallest(n=3).mean()
+        xg['hg3'] = self._mean_of_three(heads,xg.index,largest=True,
+            ).where(valid).round(2)
+        xg['lg3'] = self._mean_of_three(heads,xg.index,largest=False,
+            ).where(valid).round(2)
+        xg['hg3w'] = self._mean_of_three(winter,xg.index,largest=True,
+            ).where(valid).round(2)
+        xg['lg3s'] = self._mean_of_three(summer,xg.index,largest=False,
+            ).where(valid).round(2)
+        xg['vg3'] = self.vg3()
 
-            hg3w = np.nan
-            lg3s = np.nan
+        for date in self.VGDATES:
+            xg[f'vg_{date}'] = self.vg1(refdate=date)
 
-            if n1428 >= self.N14:
+        xg['n1428'] = n1428.astype('float64')
 
-                ts_win = ts[season(ts)=='winter']
-                ts_sum = ts[season(ts)=='summer']
-
-                hg3w = ts_win.nlargest(n=3).mean()
-                lg3s = ts_sum.nsmallest(n=3).mean()
-
-            xg.loc[year,'hg3'] = np.round(hg3,2)
-            xg.loc[year,'lg3'] = np.round(lg3,2)
-            xg.loc[year,'hg3w'] = np.round(hg3w,2)
-            xg.loc[year,'lg3s'] = np.round(lg3s,2)
-            xg['vg3'] = self.vg3()
-
-            for date in self.VGDATES:
-                xg[f'vg_{date}'] = self.vg1(refdate=date)
+        return xg
 
-            xg.loc[year,'n1428'] = n1428
 
-        return xg
+    @staticmethod
+    def _mean_of_three(heads, years, largest=True):
+        """Return mean of the three highest or lowest heads for each 
+        hydrological year in years"""
+        heads = heads.sort_values('head',ascending=not largest,
+            kind='mergesort')
+        top3 = heads.groupby('year').head(3)
+        return top3.groupby('year')['head'].mean().reindex(years)
 
 
     def xg(self, reference='datum', name=True):
@@ -11,6 +11,7 @@ import numpy as np
 from pandas import Series, DataFrame
 import pandas as pd
 import matplotlib.pyplot as plt
+from matplotlib.collections import LineCollection
 
 from .._core.gwseries import GwSeries
 from .utils import hydroyear
@@ -115,13 +116,15 @@ class Quantiles:
         unique_years = np.unique(hydroyears)
         quantiles = pd.DataFrame(index=unique_years,columns=self.qtlabels)
 
-        # calculate quantiles
+        # calculate all quantiles in one pass over the grouped heads,
+        # columns of the unstacked table are in the order of self.qt
         grp = self.ts.groupby(hydroyears)
-        for i,(name,quantile) in enumerate(zip(self.qtlabels,self.qt)):
+        yearquantiles = grp.quantile(list(self.qt)).unstack()
+        for name,quantile in zip(self.qtlabels,yearquantiles.columns):
             if self.headsref=='datum':
-                quantiles[name] = grp.quantile(quantile).round(2)
+                quantiles[name] = yearquantiles[quantile].round(2)
             elif self.headsref=='surface':
-                quantiles[name] = grp.quantile(quantile)*100
+                quantiles[name] = yearquantiles[quantile]*100
                 quantiles[name] = quantiles[name].apply(
                     lambda x:math.floor(x) if not np.isnan(x) else x)
                 ##).round(0).astype(int)
@@ -306,18 +309,25 @@ class Quantiles:
         # draw colored surface with reference
         ax.fill_between(x, upper, lower, color=csurf) 
         
-        # plot line for each year
-        for year in quantiles.index:
-            yvals = quantiles.loc[year,:].values * 100
-            xvals = self.qt
-            ax.plot(xvals,yvals,color=clines)
+        # plot line for each year, all years are added to the plot as 
+        # one collection
+        xvals = np.asarray(self.qt,dtype='float64')
+        yearvals = quantiles.to_numpy(dtype='float64') * 100
+        segments = [np.column_stack([xvals,yvals]) for yvals in yearvals]
+        ax.add_collection(LineCollection(segments,colors=clines),
+            autolim=False)
 
         # plot colored lines
-        for year in quantiles.index:
-            if year in coloryears:
-                yvals = quantiles.loc[year,:].values * 100
-                xvals = self.qt
-                ax.plot(xvals,yvals,color=cyears)
+        colored = [segment for year,segment in zip(quantiles.index,segments)
+            if year in coloryears]
+        ax.add_collection(LineCollection(colored,colors=cyears),
+            autolim=False)
+
+        # collections do not update axis limits with nan values
+        if segments:
+            points = np.concatenate(segments)
+            ax.update_datalim(points[np.isfinite(points).all(axis=1)])
+            ax.autoscale_view()
 
         if median:
             yvals = quantiles.median().values * 100
@@ -40,13 +40,18 @@ def index1428(minyear=None,maxyear=None,days=[14,28]):
 
     """
 
-    strdates = [str(year)+"-"+str(month)+"-"+str(day) #+' 12:00' 
-                for year in list(range(minyear,maxyear+1)) 
-                for month in list(range(1,13)) for day in days]
+    # first day of each month, plus day offsets, ordered by year, 
+    # month and day as in days
+    months = np.arange(f'{int(minyear):04d}-01', f'{int(maxyear)+1:04d}-01',
+        dtype='datetime64[M]')
+    offsets = np.asarray(days, dtype='timedelta64[D]') - np.timedelta64(1,'D')
+    dates = (months.astype('datetime64[D]')[:,None] + offsets[None,:]).ravel()
 
-    dates = [pd.Timestamp(x) for x in strdates]
+    # days that do not exist in a month are not rolled over
+    if np.any(dates.astype('datetime64[M]')!=np.repeat(months, len(offsets))):
+        raise ValueError((f'Not all days in {days} exist in all months.'))
 
-    return pd.DatetimeIndex(dates)
+    return pd.DatetimeIndex(dates.astype('datetime64[ns]'))
 
 
 def ts1428(sr,maxlag=0,remove_nans=True, days=[14,28]):
@@ -82,18 +87,30 @@ def ts1428(sr,maxlag=0,remove_nans=True, days=[14,28]):
     minyear = sr.index.min().year
     maxyear = sr.index.max().year
     idx1428 = index1428(minyear=minyear,maxyear=maxyear,days=days)
-    ts1428 = pd.Series(data=np.nan, index=idx1428)
 
-    # add values to timeseries ts1428
-    for date in ts1428.index:
-
-        daydeltas = sr.index - date # type(daydeltas) = TimedeltaIndex
-        mindelta = np.amin(np.abs(daydeltas))
-        sr_nearest = sr[np.abs(daydeltas) == mindelta]
-
-        maxdelta = pd.to_timedelta(f'{maxlag} days')
-        if (mindelta <= maxdelta) & (len(sr_nearest)!=0):
-            ts1428[date] = sr_nearest.iloc[0]
+    # find nearest measurement for each date with a binary search in 
+    # sorted measurement dates, for equal distances the earlier 
+    # measurement is used
+    if not sr.index.is_monotonic_increasing:
+        sr = sr.sort_index(kind='mergesort')
+    dates = sr.index.values.astype('datetime64[ns]')
+    target = idx1428.values.astype('datetime64[ns]')
+
+    pos = np.searchsorted(dates, target, side='left')
+    after = np.clip(pos, 0, len(dates)-1)
+    before = np.clip(pos-1, 0, len(dates)-1)
+    before = np.searchsorted(dates, dates[before], side='left') # first duplicate
+    dafter = np.abs(dates[after] - target)
+    dbefore = np.abs(target - dates[before])
+    nearest = np.where(dbefore<=dafter, before, after)
+    mindelta = np.minimum(dbefore, dafter)
+
+    # create timeseries ts1428 with values within maxlag days
+    maxdelta = pd.to_timedelta(f'{maxlag} days').to_timedelta64()
+    found = mindelta <= maxdelta
+    data = np.full(len(idx1428), np.nan)
+    data[found] = sr.values[nearest[found]]
+    ts1428 = pd.Series(data=data, index=idx1428)
 
     if remove_nans==True:
         ts1428 = ts1428[ts1428.first_valid_index():ts1428.last_valid_index()]
@@ -123,7 +140,13 @@ def measfrq(ts):
 
     yearfrq = ts.groupby(ts.index.year).count()
     yearfrq.index.name = 'year'
-    return yearfrq.apply(measfrqclass)
+
+    # classes of measfrqclass for all years at once
+    n = yearfrq.values
+    frqclasses = np.select([n>27, n>12, n>9, n>0], 
+        ['daily','14days','month','seldom'], default='never')
+    return Series(frqclasses.astype(object), index=yearfrq.index,
+        name=yearfrq.name)
 
 
 def maxfrq(sr):
@@ -138,7 +161,13 @@ def maxfrq(sr):
     if isinstance(sr,pd.Series):
 
         if isinstance(sr.index,pd.DatetimeIndex):
-            sr = measfrq(sr)
+            # frequency classes increase with the number of yearly 
+            # measurements, so the class of the largest count is the
+            # maximum frequency
+            if sr.empty:
+                return None
+            yearfrq = sr.groupby(sr.index.year).count()
+            return measfrqclass(yearfrq.max())
 
         #if isinstance(sr.index,pd.Int64Index):
         if is_int64_dtype(sr.index.dtype):
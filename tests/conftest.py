@@ -0,0 +1,253 @@
+
+import hashlib
+import os
+import os.path
+import pickle
+import random
+import socket
+import time
+import pytest
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import acequia
+from acequia import GwSeries
+from acequia import BroGldXml, BroGmwXml, BroGwSeries, BroGwCollection
+from acequia import geo_convert_RDtoWGS84
+from acequia import _brorest as brorest
+from acequia import KnmiDownload
+from acequia._read import knmi_download
+from acequia._read import httpsession
+
+cachedir = os.path.join('.', 'output', 'cache')
+httpcachedir = os.path.join(cachedir, 'http')
+brohost = 'publiek.broservices.nl'
+gmwdir = os.path.join('.', 'data', 'bro', 'Grondwatermonitoringput BRO')
+glddir = os.path.join('.', 'data', 'bro', 'Grondwaterstandonderzoek BRO')
+network_jitter = 0.4 # max seconds of random delay before network tests on CI
+
+def _source_fingerprint():
+    """Return short hash of the acequia version and source code.
+
+    Pickled objects are stored in a cache directory named after this
+    hash, so pickles of classes with other attributes are never
+    loaded after the source code has changed."""
+    digest = hashlib.sha1(acequia.__version__.encode())
+    srcdir = os.path.dirname(acequia.__file__)
+    for dirpath, dirnames, filenames in sorted(os.walk(srcdir)):
+        dirnames.sort()
+        for filename in sorted(filenames):
+            if filename.endswith('.py'):
+                with open(os.path.join(dirpath, filename), 'rb') as f:
+                    digest.update(f.read())
+    return digest.hexdigest()[:12]
+
+pickledir = os.path.join(cachedir, _source_fingerprint())
+brocachedir = os.path.join(pickledir, 'bro')
+
+def _load_pickle(cachepath):
+    with open(cachepath, 'rb') as f:
+        return pickle.load(f)
+
+def _dump_pickle(obj, cachepath):
+    """Write pickle to temporary file first and move it in place, so
+    concurrent test processes never read a partly written file."""
+    os.makedirs(os.path.dirname(cachepath), exist_ok=True)
+    tmppath = f'{cachepath}.{os.getpid()}.tmp'
+    with open(tmppath, 'wb') as f:
+        pickle.dump(obj, f)
+    os.replace(tmppath, cachepath)
+
+def cached_from_dinogws(filepath):
+    """Return GwSeries from dinogws file, using a pickled copy when it 
+    is newer than the source file."""
+    filename = os.path.basename(filepath)
+    cachepath = os.path.join(pickledir, f'{filename}.pkl')
+
+    if (os.path.exists(cachepath) and 
+        os.path.getmtime(cachepath)>=os.path.getmtime(filepath)):
+        return _load_pickle(cachepath)
+
+    gw = GwSeries.from_dinogws(filepath)
+    _dump_pickle(gw, cachepath)
+    return gw
+
+def cached_from_server(key, func, **kwargs):
+    """Return result of BRO server request func(**kwargs), using a 
+    pickled copy shared by all test processes when available.
+
+    Remove directory output/cache to force new downloads."""
+    cachepath = os.path.join(brocachedir, f'{key}.pkl')
+    if os.path.exists(cachepath):
+        return _load_pickle(cachepath)
+
+    if not bro_is_reachable():
+        pytest.skip(f'BRO server {brohost} is not reachable.')
+
+    obj = func(**kwargs)
+    _dump_pickle(obj, cachepath)
+    return obj
+
+_bro_reachable = None
+
+def bro_is_reachable():
+    """Return True if BRO server accepts connections (checked once)."""
+    global _bro_reachable
+    if _bro_reachable is None:
+        try:
+            socket.create_connection((brohost, 443), timeout=2).close()
+            _bro_reachable = True
+        except OSError:
+            _bro_reachable = False
+    return _bro_reachable
+
+def pytest_addoption(parser):
+    parser.addoption('--run-network', action='store_true', default=False,
+        help='run tests that download data from BRO and KNMI servers')
+    parser.addoption('--http-cache', action='store_true', default=False,
+        help='cache BRO and KNMI server responses in output/cache/http')
+
+def pytest_configure(config):
+    config.addinivalue_line('markers', 
+        'network: test downloads data from a web service')
+
+    # network tests query the live servers, unless caching is asked 
+    # for; cached responses are kept with the test output
+    if config.getoption('--http-cache') or httpsession.cache_requested():
+        brorest.enable_cache(cache_dir=httpcachedir)
+        knmi_download.enable_cache(cache_dir=httpcachedir)
+
+def pytest_collection_modifyitems(config, items):
+    """Skip tests marked network unless option --run-network is given."""
+    if config.getoption('--run-network'):
+        return
+    skip_network = pytest.mark.skip(reason='use --run-network to run')
+    for item in items:
+        if 'network' in item.keywords:
+            item.add_marker(skip_network)
+
+def pytest_runtest_setup(item):
+    """Delay network tests by a random fraction of a second when run on 
+    CI, so that simultaneous CI jobs do not hit the servers in step."""
+    if 'network' in item.keywords and os.environ.get('CI'):
+        time.sleep(random.uniform(0, network_jitter))
+
+@pytest.fixture(autouse=True)
+def close_figures():
+    """Close figures opened by each test, tests never show plots.
+
+    Figures that were open before the test started belong to fixtures
+    and are closed by these fixtures."""
+    fignums = set(plt.get_fignums())
+    yield
+    for num in set(plt.get_fignums())-fignums:
+        plt.close(num)
+
+@pytest.fixture(scope='module')
+def fig():
+    """Return one figure for all plot tests in a module."""
+    fig = plt.figure()
+    yield fig
+    fig.clear()
+    plt.close(fig)
+
+@pytest.fixture(scope='session')
+def from_dinogws():
+    """Return function for reading dinogws files with pickle cache."""
+    return cached_from_dinogws
+
+@pytest.fixture(scope='session')
+def bro_reachable():
+    """Return True if BRO server is reachable."""
+    return bro_is_reachable()
+
+@pytest.fixture(scope='session')
+def from_server():
+    """Return function for BRO server requests with pickle cache."""
+    return cached_from_server
+
+
+# BRO fixtures shared by all test modules, tests do not change them
+# -----------------------------------------------------------------
+
+@pytest.fixture(scope='session')
+def filegld():
+    xmlpath = os.path.join(glddir, 'GLD000000009526_IMBRO_A.xml')
+    return BroGldXml.from_xml(xmlpath)
+
+@pytest.fixture(scope='session')
+def itergld():
+    xmlpath = os.path.join(glddir, 'GLD000000009526_IMBRO_A.xml')
+    return BroGldXml.from_xml_iter(xmlpath)
+
+@pytest.fixture(scope='session')
+def restgld(from_server):
+    return from_server('GLD000000009526_19000101_20221231', 
+        BroGldXml.from_server, gldid='GLD000000009526', 
+        startdate='1900-01-01', enddate='2022-12-31', reference='Test')
+
+@pytest.fixture(scope='session')
+def gmwserv(from_server):
+    gmwid = 'GMW000000020136'
+    return from_server(gmwid, BroGmwXml.from_server, gmwid=gmwid, 
+        description='Testing BroGmwXml.')
+
+@pytest.fixture(scope='session')
+def gmwxml():
+    xmlpath = os.path.join(gmwdir, 'GMW000000020136_IMBRO.xml')
+    return BroGmwXml.from_xml(xmlpath)
+
+def _brogwseries_from_server(from_server, gmwid):
+    """Get BroGwSeries object for first tube of well from REST service."""
+    welltubes = from_server(f'{gmwid}_welltubes', brorest.get_welltubes,
+        gmwid=gmwid)
+    tube = welltubes.index[0]
+    return from_server(f'{gmwid}_{tube}', BroGwSeries.from_server, 
+        gmwid=gmwid, tube=tube)
+
+@pytest.fixture(scope='session')
+def brosrest(from_server):
+    """Get BroGwSeries object from REST service."""
+    return _brogwseries_from_server(from_server, 'GMW000000020136')
+
+@pytest.fixture(scope='session')
+def brosrest2(from_server):
+    """Get BroGwSeries object from REST service."""
+    return _brogwseries_from_server(from_server, 'GMW000000013875')
+
+@pytest.fixture(scope='session')
+def brosfile():
+    """Get BroGwSeries object from XML files."""
+    gmwpath = os.path.join(gmwdir, 'GMW000000020138_IMBRO.xml')
+    gldpath = os.path.join(glddir, 'GLD000000009095_IMBRO_A.xml')
+    return BroGwSeries.from_files(gmwpath=gmwpath, gldpath=gldpath)
+
+@pytest.fixture(scope='session')
+def brosfile2():
+    """Get BroGwSeries object from XML files."""
+    gmwpath = os.path.join(gmwdir, 'GMW000000013875_IMBRO_A.xml')
+    gldpath = os.path.join(glddir, 'GLD000000012658_IMBRO_A.xml')
+    return BroGwSeries.from_files(gmwpath=gmwpath, gldpath=gldpath)
+
+@pytest.fixture(scope='session')
+def brogwc(from_server):
+    """Get BroGwCollection for area Agelerbroek from REST service."""
+    lowerleft = geo_convert_RDtoWGS84(258880,489330)
+    upperright = geo_convert_RDtoWGS84(259375,489750)
+
+    return from_server('Agelerbroek', BroGwCollection.from_rectangle,
+        xmin = lowerleft[0], 
+        xmax = upperright[0],
+        ymin = lowerleft[1],
+        ymax = upperright[1],
+        name = 'Agelerbroek',
+        )
+
+
+# KNMI fixtures
+# -------------
+
+@pytest.fixture(scope='session')
+def knmi():
+    """Return one KnmiDownload object for all tests."""
+    return KnmiDownload()
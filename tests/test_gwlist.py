@@ -20,3 +20,11 @@ def test_GwList_init():
         # srcdir does not exist
         gwl = aq.GwList(srcdir='dummy')
 
+
+def test_GwList_paths():
+    gwl = aq.GwList(srcdir=dinodir)
+    paths = gwl.paths()
+    assert len(paths)==len(gwl)
+    gw = gwl.from_path(paths[0])
+    assert isinstance(gw, aq.GwSeries)
+    assert gw.name()==next(gwl).name()
@@ -0,0 +1,19 @@
+
+import pytest
+import matplotlib
+matplotlib.use('Agg')
+from acequia import plot_tubechanges
+
+dnpath = r'.\data\dinogws\B29A0850002_1.csv'
+figdir = '.\\output\\fig\\'
+
+@pytest.fixture
+def gw(from_dinogws):
+    return from_dinogws(dnpath)
+
+def test_plot_tubechanges(gw, fig):
+    fig.clear()
+    ax = fig.add_subplot()
+    ax = plot_tubechanges(gw=gw, ax=ax)
+    assert isinstance(ax, matplotlib.axes.Axes)
+    fig.savefig(f'{figdir}tubechanges.jpg')
@@ -0,0 +1,59 @@
+
+import pytest
+import matplotlib
+matplotlib.use('Agg')
+from acequia import PlotHeads
+
+dinodir = '.\\data\\dinogws\\'
+figdir = '.\\output\\fig\\'
+srnames = ['B29A0850002_1','B29A0848001_1','B29A0848002_1','B29A0848003_1']
+
+@pytest.fixture(scope='module')
+def gwdict(from_dinogws):
+    """Read all test series once for the whole module."""
+    return {name:from_dinogws(f'{dinodir}{name}.csv') 
+        for name in srnames}
+
+@pytest.fixture(scope='module')
+def gw(gwdict):
+    return gwdict['B29A0850002_1']
+
+@pytest.fixture(scope='module')
+def gwlist(gwdict):
+    return [gwdict[name] for name in srnames[1:]]
+
+@pytest.fixture(scope='module')
+def sr1(gw):
+    return gw.heads(ref='datum')
+
+@pytest.fixture(scope='module')
+def sr2(gwlist):
+    return gwlist[0].heads(ref='datum')
+
+@pytest.fixture(scope='module')
+def sr3(gwlist):
+    return gwlist[1].heads(ref='datum')
+
+@pytest.fixture(scope='module')
+def sr4(gwlist):
+    return gwlist[2].heads(ref='datum')
+
+def test_plotheads_single(sr1, fig):
+    plot = PlotHeads(ts=[sr1], fig=fig)
+    assert plot.get_fig() is fig
+    plot.save(f'{figdir}plotheads_single.jpg')
+
+def test_plotheads_multiple(sr2, sr3, sr4, fig):
+    plot = PlotHeads(ts=[sr2, sr3, sr4], ref='datum', title='Test', fig=fig)
+    assert plot.get_fig() is fig
+    plot.save(f'{figdir}plotheads_multiple.jpg')
+
+def test_plotheads_surface(gwlist, fig):
+    plot = PlotHeads(ts=gwlist, ref='surface', fig=fig)
+    plot.save(f'{figdir}plotheads_surface.jpg')
+
+def test_plotheads_mps(gw, sr1, fig):
+    mps = gw.tubeprops_changes(proptype='mplevel')
+    plot = PlotHeads(ts=[sr1], mps=mps, fig=fig)
+    assert 'axmp' in plot.axeslist
+    plot.save(f'{figdir}plotheads_mps.jpg')
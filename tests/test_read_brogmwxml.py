@@ -4,21 +4,6 @@ from pandas import Series, DataFrame
 from pandas import DataFrame
 from acequia import BroGmwXml
 
-@pytest.fixture
-def gmwid():
-    return 'GMW000000020136'
-
-@pytest.fixture
-def gmwserv(gmwid):
-    gmw = BroGmwXml.from_server(gmwid=gmwid, description='Testing BroGmwXml.')
-    return gmw
-
-@pytest.fixture
-def gmwxml():
-    xmlpath = r'.\data\bro\Grondwatermonitoringput BRO\GMW000000020136_IMBRO.xml'
-
-    gmw = BroGmwXml.from_xml(xmlpath)
-    return gmw
 
 # test constructors
 # -----------------
@@ -38,26 +23,26 @@ def test_bad_file():
 # test methods
 # ------------
 
-@pytest.mark.parametrize('gmw', [gmwserv, gmwxml])
+@pytest.mark.parametrize('gmw', ['gmwserv', 'gmwxml'])
 def test_events(gmw, request):
-    gmw = request.getfixturevalue(gmw.__name__)
+    gmw = request.getfixturevalue(gmw)
     assert isinstance(gmw.events, DataFrame)
 
-@pytest.mark.parametrize('gmw', [gmwserv, gmwxml])
+@pytest.mark.parametrize('gmw', ['gmwserv', 'gmwxml'])
 def test_tubeprops(gmw, request):
-    gmw = request.getfixturevalue(gmw.__name__)
+    gmw = request.getfixturevalue(gmw)
     df = gmw.tubeprops
     assert isinstance(df, DataFrame)
     assert not df.empty
 
-@pytest.mark.parametrize('gmw', [gmwserv, gmwxml])
+@pytest.mark.parametrize('gmw', ['gmwserv', 'gmwxml'])
 def test_wellprops(gmw, request):
-    gmw = request.getfixturevalue(gmw.__name__)
+    gmw = request.getfixturevalue(gmw)
     sr = gmw.wellprops
     assert isinstance(sr, Series)
     assert not sr.empty
 
-@pytest.mark.parametrize('gmw', [gmwserv, gmwxml])
+@pytest.mark.parametrize('gmw', ['gmwserv', 'gmwxml'])
 def test_wellprops(gmw, request):
-    gmw = request.getfixturevalue(gmw.__name__)
+    gmw = request.getfixturevalue(gmw)
     assert isinstance(gmw.gmwid, str)
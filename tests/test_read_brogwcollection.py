@@ -3,58 +3,62 @@
 import pytest
 from pandas import Series, DataFrame
 
-from acequia import _brorest as brorest
-from acequia import BroGwCollection
-from acequia import geo_convert_RDtoWGS84
 from acequia import GwSeries
 
-@pytest.fixture
-def gwc():
 
-    lowerleft = geo_convert_RDtoWGS84(258880,489330)
-    upperright = geo_convert_RDtoWGS84(259375,489750)
-
-    gwc = BroGwCollection.from_rectangle(
-        xmin = lowerleft[0], 
-        xmax = upperright[0],
-        ymin = lowerleft[1],
-        ymax = upperright[1],
-        name = 'Agelerbroek',
-        )
-
-    return gwc
-
-def test_wells(gwc):
-    df = gwc.wells
+def test_wells(brogwc):
+    df = brogwc.wells
     assert isinstance(df, DataFrame)
     assert not df.empty
 
-def test_tubes(gwc):
-    df = gwc.tubes
+def test_tubes(brogwc):
+    df = brogwc.tubes
     assert isinstance(df, DataFrame)
     assert not df.empty
 
-def test_get_gwseries(gwc):
+def test_lookup(brogwc):
+    gmwid = brogwc.tubes['gmwid'].iloc[0]
+    well = brogwc.lookup(gmwid=gmwid)
+    assert well['gmwid']==gmwid
+    assert isinstance(well['wellcode'], str)
+    assert len(well['tubes'])!=0
+
+    well2 = brogwc.lookup(wellcode=well['wellcode'])
+    assert well2==well
+
+    well3 = brogwc.lookup(wellcode='Nergenshuizen')
+    assert well3['gmwid'] is None
+    assert len(well3['tubes'])==0
+
+def test_get_gwseries(brogwc, bro_reachable):
+    if not bro_reachable:
+        pytest.skip('BRO server is not reachable.')
 
     # test with gmwid
-    gmwid = gwc._tubes.at[0,'gmwid']
-    tube = gwc._tubes.at[0,'tubenr']
+    well = brogwc.lookup(gmwid=brogwc.tubes['gmwid'].iloc[0])
+    gmwid = well['gmwid']
+    tube = well['tubes'][0]
 
-    gw = gwc.get_gwseries(gmwid=gmwid, wellcode=None, tube=tube)
+    gw = brogwc.get_gwseries(gmwid=gmwid, wellcode=None, tube=tube)
     assert isinstance(gw, GwSeries)
     assert not gw.tubeprops().empty
 
     # test with wellcode
-    wellcode = gwc._wells.loc[0,'wellcode']
-    idx = gwc._wells[gwc._wells['wellcode']==wellcode].index[0]
-    gmwid = gwc._wells.loc[idx,'gmwid']
-    idx = gwc._tubes[gwc._tubes['gmwid']==gmwid].index[0]
-    tube = gwc._tubes.loc[idx,'tubenr']
-
-    gw = gwc.get_gwseries(gmwid=None, wellcode=wellcode, tube=tube)
+    wellcode = well['wellcode']
+    gw = brogwc.get_gwseries(gmwid=None, wellcode=wellcode, tube=tube)
     assert isinstance(gw, GwSeries)
     assert not gw.tubeprops().empty
 
-def test_iteritems(gwc):
-    for gw in gwc.iteritems():
-        assert isinstance(gw.name(), str)
+def test_names(brogwc):
+    names = brogwc.names
+    assert isinstance(names, list)
+    assert len(names)==len(brogwc)
+    for name in names:
+        assert isinstance(name, str)
+
+def test_iteritems(brogwc, bro_reachable):
+    if not bro_reachable:
+        pytest.skip('BRO server is not reachable.')
+    # downloading all series takes long, only the first one is tested
+    gw = next(brogwc.iteritems())
+    assert gw.name() in brogwc.names
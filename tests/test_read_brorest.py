@@ -7,19 +7,32 @@ from xml.etree.ElementTree import ElementTree
 from acequia import _brorest
 from acequia import BroGmwXml, BroGldXml
 
+pytestmark = pytest.mark.network
 
-@pytest.fixture
+@pytest.fixture(autouse=True)
+def skip_offline(bro_reachable):
+    if not bro_reachable:
+        pytest.skip('BRO server is not reachable.')
+
+@pytest.fixture(scope='module')
 def gmwid():
     return 'GMW000000041145'
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def brogld():
     return 'GLD000000010138'
     
-@pytest.fixture
+@pytest.fixture(scope='module')
 def broinstantie():
     return '51048329'
 
+@pytest.fixture(scope='module')
+def welltubes(gmwid, bro_reachable):
+    """Download well tubes once for all tests in this module."""
+    if not bro_reachable:
+        pytest.skip('BRO server is not reachable.')
+    return _brorest.get_welltubes(gmwid)
+
 def test_getareawellprops():
 
     circle = _brorest.get_area_wellprops(lowerleft=None,upperright=None,
@@ -32,8 +45,8 @@ def test_getareawellprops():
     assert isinstance(rectangle,DataFrame)
     assert not rectangle.empty
 
-def test_getwelltubes(gmwid):
-    tubes = _brorest.get_welltubes(gmwid)
+def test_getwelltubes(welltubes):
+    tubes = welltubes
     assert isinstance(tubes, DataFrame)
     assert not tubes.empty
 
@@ -43,21 +56,28 @@ def test_getwellcode(gmwid):
     assert len(wellcode)!=0
 
 def test_getgmwcodes(broinstantie):
-    gmwlist = _brorest.get_gmw_codes('51048329')
+    gmwlist = _brorest.get_gmw_codes(broinstantie)
     assert isinstance(gmwlist,list)
     assert len(gmwlist)!=0
 
 def test_getgldcodes(broinstantie):
-    gldlist = _brorest.get_gld_codes('51048329')
+    gldlist = _brorest.get_gld_codes(broinstantie)
     assert isinstance(gldlist,list)
     assert len(gldlist)!=0
 
 def test_getwellprops(gmwid):
     props = _brorest.get_wellprops(gmwid)
     assert isinstance(props, ElementTree)
-    assert len(list(props.iter()))!=0
+    assert next(props.iter(), None) is not None
 
 def test_getlevels(brogld):
     levels = _brorest.get_levels(brogld) #'GLD000000010138') #'GLD000000009881')
     assert isinstance(levels, ElementTree)
-    assert len(list(levels.iter()))!=0
+    assert next(levels.iter(), None) is not None
+
+def test_getmany(gmwid, welltubes):
+    tubelist = _brorest.get_many(_brorest.get_welltubes, [gmwid, gmwid])
+    assert isinstance(tubelist, list)
+    assert len(tubelist)==2
+    for tubes in tubelist:
+        assert tubes.equals(welltubes)
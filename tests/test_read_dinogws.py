@@ -3,11 +3,12 @@ from datetime import datetime
 from pandas import DataFrame, Series
 from acequia import DinoGws, GwSeries
 from acequia._read.dinogws import filesfromdir
+from acequia._read.dinogws import _datatext_from_csv, _datatext_from_split
 
 fpath = r'.\data\dinogws\B28A0475002_1.csv'
 fdir = r'.\data\dinogws\\'
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def dn():
     dn = DinoGws(filepath=fpath,readall=True)
     assert isinstance(dn,DinoGws)
@@ -68,6 +69,9 @@ def test_filesfromdir(fdir=fdir):
     assert isinstance(res,tuple)
     assert len(res)==2
 
+def test_filesfromdir_missing():
+    assert filesfromdir('dummy')==([],[])
+
 
 # test private methods
 
@@ -94,3 +98,18 @@ def test__readgws(dn):
     assert isinstance(dn._readgws(),DataFrame)
     assert not dn._readgws().empty
 
+
+def test__datatext_from_csv():
+    lines = [
+        'B28A0475,002,14-01-1985,120,80,1500,,,,,\n',
+        'B28A0475,002,28-01-1985,,,,,meetpunt gewijzigd,,,\n',
+        'B28A0475,002,14-02-1985,118,78,1502,D,,,,\n',
+        ]
+    datatext = _datatext_from_csv(lines, DinoGws.DATACOLS)
+    assert datatext is not None
+    assert datatext.equals(_datatext_from_split(lines, DinoGws.DATACOLS))
+    assert datatext.at[0,'opmerking']==',,,'
+
+    # separators in remarks are left to the split path
+    lines.append('B28A0475,002,28-02-1985,,,,,droog, niet gemeten,,,\n')
+    assert _datatext_from_csv(lines, DinoGws.DATACOLS) is None
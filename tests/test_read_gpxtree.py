@@ -40,7 +40,10 @@ def test_meta(gpxtree):
     assert isinstance(gpxtree.meta, collections.abc.Mapping)
 
 def test_bounds(gpxtree):
-    assert isinstance(gpxtree.bounds, collections.abc.Mapping)
+    bounds = gpxtree.bounds
+    assert isinstance(bounds, collections.abc.Mapping)
+    assert bounds['minlat']<=bounds['maxlat']
+    assert bounds['minlon']<=bounds['maxlon']
 
 def test_trackpoints(gpxtree):
     assert isinstance(gpxtree.trackpoints,DataFrame)
@@ -4,7 +4,7 @@ from pandas import Series, DataFrame
 
 fpath = r'.\data\hymon\hydromonitor_testdata.csv'
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def hm():
     return HydroMonitor(fpath)
 
@@ -3,51 +3,58 @@
 import pytest
 from pandas import Series, DataFrame
 from geopandas import GeoDataFrame
-from acequia import KnmiDownload
 from acequia import get_knmi_evaporation, get_knmi_precipitation
 from acequia import get_knmi_weatherstations, get_knmi_precstations
+from acequia import KnmiDownload
+from acequia._read import knmi_download
 
 
-def test_bad_request_weather():
+def test_session_pool():
+    """Weather and precipitation requests share one connection pool"""
+    session = knmi_download.session()
+    adapter = session.get_adapter(KnmiDownload.WEATHER_URL)
+    assert adapter is session.get_adapter(KnmiDownload.PRECIPITATION_URL)
+    assert adapter.max_retries.total==3
+    assert knmi_download.POOL_MAXSIZE >= knmi_download.MAX_WORKERS
+
+@pytest.mark.network
+def test_bad_request_weather(knmi):
     """Request weather date from server""" 
-    stn = KnmiDownload()
-    res = stn._request_weather(par=None)
+    res = knmi._request_weather(par=None)
     assert res.status_code==200
 
-def test_bad_request_precipitation():
+@pytest.mark.network
+def test_bad_request_precipitation(knmi):
     """Request weather date from server""" 
-    stn = KnmiDownload()
-    res = stn._request_precipitation(par=None)
+    res = knmi._request_precipitation(par=None)
     assert res.status_code==200
 
-def test_download_with_weather():
-    stn = KnmiDownload()
-    data = stn.get_rawdata(kind='weather',result='data')
+@pytest.mark.network
+def test_download_with_weather(knmi):
+    data = knmi.get_rawdata(kind='weather',result='data')
     assert isinstance(data,DataFrame)
-    text = stn.get_rawdata(kind='weather',result='text')
+    text = knmi.get_rawdata(kind='weather',result='text')
     assert isinstance(text,str)
 
-def test_download_with_prc():
-    stn = KnmiDownload()
-    data = stn.get_rawdata(kind='precipitation')
+@pytest.mark.network
+def test_download_with_prc(knmi):
+    data = knmi.get_rawdata(kind='precipitation')
     assert isinstance(data,DataFrame)
-    text = stn.get_rawdata(kind='precipitation', result='text')
+    text = knmi.get_rawdata(kind='precipitation', result='text')
     assert isinstance(text,str)
 
-def test_wtr_stns():
-    knmi = KnmiDownload()
+def test_wtr_stns(knmi):
     data = knmi.get_weather_stations()
     assert isinstance(data,DataFrame)
     assert not data.empty
 
-def test_prc_stns():
-    knmi = KnmiDownload()
+def test_prc_stns(knmi):
     data = knmi.get_precipitation_stations()
     assert isinstance(data,DataFrame)
     assert not data.empty
 
-def test_get_precipitation():
-    knmi = KnmiDownload()
+@pytest.mark.network
+def test_get_precipitation(knmi):
     data = knmi.get_precipitation(station='327', name=None, start=None, end=None)
     assert isinstance(data,Series)
     assert not data.empty
@@ -69,9 +76,8 @@ def test_get_precipitation():
     with pytest.raises(ValueError):
         knmi.get_precipitation(station=None, name=None, kind='weather')
 
-def test_get_evaporation():
-    knmi = KnmiDownload()
-
+@pytest.mark.network
+def test_get_evaporation(knmi):
     sr = knmi.get_evaporation(name='Nieuw Beerta')
     assert isinstance(sr, Series)
     assert not sr.empty
@@ -86,8 +92,8 @@ def test_get_evaporation():
     with pytest.raises(ValueError):
         knmi.get_evaporation(name='Nergenshuizen')
 
-def test_get_weather():
-    knmi = KnmiDownload()
+@pytest.mark.network
+def test_get_weather(knmi):
     data = knmi.get_weather(station='260', name=None, start=None, end=None)
     assert isinstance(data,DataFrame)
     assert not data.empty
@@ -96,10 +102,8 @@ def test_get_weather():
     assert isinstance(data,DataFrame)
     assert not data.empty
 
-def test_get_station_metadata():
+def test_get_station_metadata(knmi):
 
-    knmi = KnmiDownload()
-    
     sr = knmi.get_station_metadata('745')
     assert isinstance(sr, Series)
     assert not sr.empty
@@ -116,9 +120,7 @@ def test_get_station_metadata():
     assert isinstance(sr, Series)
     assert sr.empty
 
-def test_get_station_code():
-
-    knmi = KnmiDownload()
+def test_get_station_code(knmi):
 
     code = knmi.get_station_code('Zwolle')
     assert isinstance(code, str)
@@ -132,20 +134,21 @@ def test_get_station_code():
     code = knmi.get_station_code('Nergenshuizen', kind='weather')
     assert code is None
 
-def test_get_distance():
+def test_get_distance(knmi):
 
     PREC_STN_COUNTS = 329
     WTR_STN_COUNTS = 36
     LATLON = (52.51221297354996, 6.089788276983239)
     XY = (202694.86683117278, 502957.1681540037)
 
-    knmi = KnmiDownload()
-
     # input: weather station code
     ds = knmi.get_distance(kind='weather', stn=knmi.DEFAULT_WTR)
     assert isinstance(ds, DataFrame)
     assert not ds.empty
     assert len(ds)==WTR_STN_COUNTS # test breaks if knmi changes number of stations
+    assert ds.index[0]==knmi.DEFAULT_WTR
+    assert ds['distance_km'].iloc[0]==0
+    assert ds['distance_km'].is_monotonic_increasing
 
     # input: precipitation station code
     ds = knmi.get_distance(kind='precipitation', stn=knmi.DEFAULT_PREC)
@@ -186,9 +189,35 @@ def test_get_distance():
     assert not ds.empty
     assert len(ds)==PREC_STN_COUNTS
 
-def test_nan_replacements():
+def test_get_distance_batch(knmi):
+    queries = [
+        {'kind':'weather', 'stn':knmi.DEFAULT_WTR},
+        {'kind':'precipitation', 'name':'Zwolle'},
+        {'kind':'weather', 'xy':(202694.87, 502957.17)},
+        ]
+    tables = knmi.get_distance_batch(queries)
+    assert len(tables)==len(queries)
+    for query, ds in zip(queries, tables):
+        assert isinstance(ds, DataFrame)
+        assert ds.equals(knmi.get_distance(**query))
+
+@pytest.mark.network
+def test_get_many(knmi):
+    stations = ['327','550']
+    data = knmi.get_many('get_precipitation', stations, fillnans=False)
+    assert list(data.keys())==stations
+    for sr in data.values():
+        assert isinstance(sr, Series)
+
+def test_get_many_invalid(knmi):
+    with pytest.raises(ValueError):
+        knmi.get_many('get_distance', ['327','550'])
+
+    with pytest.raises(ValueError):
+        knmi.get_many('get_precipitation')
 
-    knmi = KnmiDownload()
+@pytest.mark.network
+def test_nan_replacements(knmi):
     startdate = '19720115'
     enddate = '19720215'
     prec = knmi.get_precipitation(name='Finsterwolde', start=startdate, end=enddate, fillnans=False)
@@ -198,7 +227,6 @@ def test_nan_replacements():
     assert isinstance(repldata, DataFrame)
     assert not repldata.empty
 
-    knmi = KnmiDownload()
     startdate = '19900101'
     enddate = '19900301'
     df = knmi.get_weather(name='Nieuw Beerta', start=startdate, end=enddate, fillnans=False)
@@ -211,6 +239,7 @@ def test_nan_replacements():
     assert not repldata.empty
 
 
+@pytest.mark.network
 def test_functions():
 
     sr = get_knmi_precipitation(station='327')
@@ -237,17 +266,23 @@ def test_functions():
     assert isinstance(data, DataFrame)
     assert not data.empty
 
-def test_duplicates():
+def test_duplicates(knmi):
 
-    knmi = KnmiDownload()
     df = knmi.duplicate_station_names
     assert isinstance(df, DataFrame)
     assert not df.empty
     assert len(df)==23 # breaks if knmi changes number of stations
 
-    knmi = KnmiDownload()
     df = knmi.duplicate_station_codes
     assert isinstance(df, DataFrame)
     assert not df.empty
     assert len(df)==13 # breaks if knmi changes number of stations
 
+
+def test_station_tables_are_copies():
+    data = get_knmi_weatherstations(geo=True)
+    data['stn_name'] = None
+    assert get_knmi_weatherstations(geo=True)['stn_name'].notnull().all()
+    data = get_knmi_precstations(geo=False)
+    data['stn_name'] = None
+    assert get_knmi_precstations(geo=False)['stn_name'].notnull().all()
@@ -5,7 +5,7 @@ from acequia import KnmiRain
 
 fpath = r'.\data\knmi_prc\550_debilt.txt'
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def prec():
     return KnmiRain(filepath=fpath)
 
@@ -6,7 +6,7 @@ from acequia import KnmiWeather
 ##fpath = r'.\data\knmi_weather\etmgeg_251.txt' 
 fpath = r'.\data\knmi_weather\260_debilt.txt'
 
-@pytest.fixture
+@pytest.fixture(scope='module')
 def wtr():
     return KnmiWeather(filepath=fpath)
 
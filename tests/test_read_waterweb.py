@@ -94,3 +94,9 @@ def test_measurement_types():
     tbl = measurement_types(wwdir)
     assert isinstance(tbl,pd.DataFrame)
     assert tbl.empty is False
+
+def test_measurement_types_cached():
+    tbl1 = measurement_types(wwdir)
+    tbl2 = measurement_types(wwdir, zeros=False)
+    assert tbl1.shape==tbl2.shape
+    assert tbl1.equals(measurement_types(wwdir))
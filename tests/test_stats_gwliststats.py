@@ -0,0 +1,27 @@
+import pytest
+from pandas import DataFrame
+import acequia as aq
+
+dinodir = '.\\data\\dinogws\\'
+
+def test_srstats():
+    gls = aq.GwListStats(srcdir=dinodir)
+    srstats = gls.srstats()
+    assert isinstance(srstats, DataFrame)
+    assert not srstats.empty
+
+    # series read one by one give the same table in the same order
+    serial = aq.GwListStats(srcdir=dinodir).srstats(max_workers=1)
+    assert list(serial.index)==list(srstats.index)
+    assert serial.equals(srstats)
+
+def test_srstats_scanned_once():
+    gls = aq.GwListStats(srcdir=dinodir)
+    srstats = gls.srstats()
+    assert gls.srstats().equals(srstats)
+
+    # cached tables are returned as copies
+    srstats['locname'] = None
+    assert not gls.srstats().equals(srstats)
+    assert isinstance(gls.xg(), DataFrame)
+    assert isinstance(gls.locstats(), DataFrame)
@@ -7,10 +7,15 @@ import matplotlib
 from acequia import Quantiles
 from acequia import GwSeries
 
-@pytest.fixture
-def gw():
-    fpath = r'.\data\dinogws\B21A0138001_1.csv'
-    return GwSeries.from_dinogws(fpath)
+dnpath = r'.\data\dinogws\B21A0138001_1.csv'
+dnpath2 = r'.\data\dinogws\B01D0143001_1.csv'
+
+# source files are read once per module, tests do not change the
+# GwSeries and Quantiles objects
+
+@pytest.fixture(scope='module')
+def gw(from_dinogws):
+    return from_dinogws(dnpath)
 
 
 def test_init(gw):
@@ -30,17 +35,13 @@ def test_init(gw):
     assert qt.__class__.__name__=='Quantiles'
     
 
-@pytest.fixture
-def qt():
-    fpath = r'.\data\dinogws\B21A0138001_1.csv'
-    gw = GwSeries.from_dinogws(fpath)
+@pytest.fixture(scope='module')
+def qt(gw):
     return Quantiles(gw)
 
-@pytest.fixture
-def qt2():
-    fpath = r'.\data\dinogws\B01D0143001_1.csv'
-    gw = GwSeries.from_dinogws(fpath)
-    return Quantiles(gw)
+@pytest.fixture(scope='module')
+def qt2(from_dinogws):
+    return Quantiles(from_dinogws(dnpath2))
 
 
 def test_quantiles(qt):
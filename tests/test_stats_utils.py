@@ -0,0 +1,45 @@
+
+import pytest
+import numpy as np
+import pandas as pd
+from pandas import Series
+from acequia import get_tsindex1428, get_ts1428
+from acequia import get_tsmeasfrq, get_tsmaxfrq
+
+
+def test_index1428():
+    idx = get_tsindex1428(minyear=2000, maxyear=2001)
+    assert isinstance(idx, pd.DatetimeIndex)
+    assert len(idx)==48
+    assert idx[0]==pd.Timestamp('2000-01-14')
+    assert idx[-1]==pd.Timestamp('2001-12-28')
+    assert idx.is_monotonic_increasing
+
+    with pytest.raises(ValueError):
+        get_tsindex1428(minyear=2000, maxyear=2000, days=[14,30])
+
+def test_ts1428():
+    dates = pd.to_datetime(['2000-01-12','2000-01-16','2000-01-28',
+        '2000-02-16','2000-02-26','2000-03-02'])
+    sr = Series([1.,2.,3.,4.,5.,6.], index=dates)
+
+    ts = get_ts1428(sr, maxlag=0)
+    assert list(ts.values)==[3.]
+
+    # equal distance to 12th and 16th, earlier measurement is used
+    ts = get_ts1428(sr, maxlag=3, remove_nans=False)
+    assert ts[pd.Timestamp('2000-01-14')]==1.
+    assert ts[pd.Timestamp('2000-02-14')]==4.
+    assert ts[pd.Timestamp('2000-02-28')]==5.
+    assert np.isnan(ts[pd.Timestamp('2000-03-14')])
+
+def test_measfrq_maxfrq():
+    dates = pd.date_range('2000-01-01','2001-12-31',freq='D')
+    sr = Series(1., index=dates)
+    sr = sr[(sr.index.year==2000)|(sr.index.day==14)]
+
+    frq = get_tsmeasfrq(sr)
+    assert list(frq.index)==[2000,2001]
+    assert list(frq.values)==['daily','month']
+    assert get_tsmaxfrq(sr)=='daily'
+    assert get_tsmaxfrq(sr[sr.index.year==2001])=='month'